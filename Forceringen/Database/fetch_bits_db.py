@@ -25,6 +25,36 @@ class PLCBitRepositoryAsync:
     Date: 03/06/2025
     Author: TOVY
     """
+    # SQL sent on every click, kept as constants so the same query text is reused.
+    # forced_at_date is forced_at formatted by SQL Server as dd-mm-yyyy (style 105),
+    # ready for the tables, so rendering them needs no date formatting per row
+    PLC_BITS_QUERY = """
+        SELECT *, CONVERT(varchar(10), forced_at, 105) AS forced_at_date
+        FROM plc_bits
+        WHERE PLC = :plc_name
+    """
+    PLC_RESOURCE_BITS_QUERY = """
+        SELECT *, CONVERT(varchar(10), forced_at, 105) AS forced_at_date
+        FROM plc_bits
+        WHERE PLC = :plc_name
+          AND resource = :resource_name
+    """
+    BIT_HISTORY_QUERY = """
+        SELECT *
+        FROM last_5_force_reasons_per_bit
+        WHERE PLC = :plc_name
+          AND resource = :resource_name
+          AND bit_number = :bit_number
+        ORDER BY forced_at DESC;
+    """
+    INSERT_REASON_QUERY = (
+        "EXEC insert_force_reason :plc_name, :resource_name, :bit_number, :reason_text, :melding_text, :forced_text"
+    )
+
+    # Running fetch_plc_bits queries: (event loop, plc_name, resource_name) -> task.
+    # Identical fetches that overlap share one query instead of each sending their own
+    _fetches_in_flight = {}
+
     def __init__(self, config_loader):
         """
         Information:
@@ -43,38 +73,55 @@ class PLCBitRepositoryAsync:
     async def fetch_plc_bits(self, plc_name, resource_name=None):
         """
         Asynchronously fetch PLC bits from database, optionally filtered by resource.
+        A call made while the same fetch is still running waits for that query
+        and gets its own copy of the rows, nothing is kept after the query ends.
         Args:
             plc_name: The name of the PLC to filter by
             resource_name: Optional resource name to filter by
         Returns:
             List of results from database
         """
+        key = (asyncio.get_running_loop(), plc_name, resource_name)
+        task = self._fetches_in_flight.get(key)
+        if task is not None:
+            results = await asyncio.shield(task)
+            # Rows are changed in place by the save handler, so joined callers get copies
+            return [dict(row) if isinstance(row, dict) else row for row in results]
+
+        task = asyncio.ensure_future(self._query_plc_bits(plc_name, resource_name))
+        self._fetches_in_flight[key] = task
+        task.add_done_callback(lambda _: self._fetches_in_flight.pop(key, None))
+        # Shielded, so a cancelled caller does not cancel the query of the callers that joined it
+        return await asyncio.shield(task)
+
+    async def _query_plc_bits(self, plc_name, resource_name=None):
+        """
+        Information:
+            Run the plc_bits query of fetch_plc_bits() on a pooled connection.
+            Errors are returned as an ("ERROR", message) row, as fetch_plc_bits() always did.
+
+        Parameters:
+            Input: plc_name - The name of the PLC to filter by
+                  resource_name - Optional resource name to filter by
+            Output: List of results from database
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
         try:
-            # Get a standalone async connection
-            conn = await self.db_connection.get_connection(is_async=True)
-            try:
+            # Borrow a pooled async connection
+            async with self.db_connection.acquire() as conn:
                 if resource_name:
-                    sql = """
-                        SELECT *
-                        FROM plc_bits
-                        WHERE PLC = :plc_name
-                          AND resource = :resource_name
-                    """
-                    results = await conn.fetch_all(sql, {"plc_name": plc_name, "resource_name": resource_name})
+                    results = await conn.fetch_all(
+                        self.PLC_RESOURCE_BITS_QUERY, {"plc_name": plc_name, "resource_name": resource_name}
+                    )
 
                 else:
-                    sql = """
-                        SELECT *
-                        FROM plc_bits
-                        WHERE PLC = :plc_name
-                    """
-                    results = await conn.fetch_all(sql, {"plc_name": plc_name})
+                    results = await conn.fetch_all(self.PLC_BITS_QUERY, {"plc_name": plc_name})
                 
-                # Convert results to list of dictionaries
-                return [record for record in results]
+                # fetch_all already returns a list of dictionaries
+                return results
 
-            finally:
-                await conn.disconnect()
         except Exception as e:
             import traceback
             error_msg = f"Database error: {str(e)}\n{traceback.format_exc()}"
@@ -96,40 +143,44 @@ class PLCBitRepositoryAsync:
         Author: TOVY
         """
         try:
-            # Use unified database connection
-            conn = await self.db_connection.get_connection(is_async=True)
-
-            try:
-                plc_name = bit_data.get('PLC') or selected_plc
-                resource_name = bit_data.get('resource')
-                bit_number = bit_data.get('bit_number')
-
-                # Query with SQL Server syntax (named parameters)
-                history_query = """
-                    SELECT *
-                    FROM last_5_force_reasons_per_bit
-                    WHERE PLC = :plc_name
-                      AND resource = :resource_name
-                      AND bit_number = :bit_number
-                    ORDER BY forced_at DESC;
-                """
-
-                history_results = await conn.fetch_all(history_query, {
-                    "plc_name": plc_name,
-                    "resource_name": resource_name,
-                    "bit_number": bit_number
-                })
-
-                print(f"Fetched {len(history_results)} history records for bit {bit_number}")
-                return history_results
-
-            finally:
-                await conn.disconnect()
+            # Borrow a pooled async connection
+            async with self.db_connection.acquire() as conn:
+                return await self.fetch_bit_history_on(conn, bit_data, selected_plc)
 
         except Exception as e:
             print(f"Error fetching bit history: {str(e)}")
             return []
 
+    async def fetch_bit_history_on(self, conn, bit_data, selected_plc=None):
+        """
+        Information:
+            Fetches the last 5 force history records for a selected bit on an existing connection,
+            so callers that already hold a connection save a second pool acquire.
+            The connection is left open for the caller.
+
+        Parameters:
+            Input: conn - Open async DatabaseConnectionWrapper
+                  bit_data - Dictionary containing information about the selected bit
+                  selected_plc - Optional PLC name override
+            Output: List of history records from the database
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        plc_name = bit_data.get('PLC') or selected_plc
+        resource_name = bit_data.get('resource')
+        bit_number = bit_data.get('bit_number')
+
+        # Query with SQL Server syntax (named parameters)
+        history_results = await conn.fetch_all(self.BIT_HISTORY_QUERY, {
+            "plc_name": plc_name,
+            "resource_name": resource_name,
+            "bit_number": bit_number
+        })
+
+        print(f"Fetched {len(history_results)} history records for bit {bit_number}")
+        return history_results
+
 if __name__ == "__main__":
     # You need to create an instance of the class and a config_loader
     # This is just an example - you'll need to import and create your actual config_loader
@@ -83,36 +83,32 @@ class PLCResourceSync:
         Synchronize PLCs and resources between YAML and database (asynchronous version).
         Uses the unified DatabaseConnection for database operations.
         """
-        # Get async connection
-        conn = await self.db_connection.get_connection(is_async=True)
-        
-        try:
-            # Extract data from YAML
-            self._extract_yaml_data()
-
-            # Get existing PLCs and resources from database
-            db_plcs = set()
-            records = await conn.fetch_all("SELECT plc_name FROM plc")
-            for record in records:
-                db_plcs.add(record['plc_name'])
-
-            db_resources = set()
-            records = await conn.fetch_all("SELECT resource_name FROM resource")
-            for record in records:
-                db_resources.add(record['resource_name'])
-
-            # Get existing PLC-resource pairs to identify removed combinations
-            db_plc_resources = set()
-            records = await conn.fetch_all("""
+        # Extract data from YAML
+        self._extract_yaml_data()
+
+        # Get existing PLCs, resources and PLC-resource pairs from the database,
+        # the three independent queries run at the same time on their own pooled connections
+        plc_records, resource_records, plc_resource_records = await self.db_connection.gather_queries([
+            ("SELECT plc_name FROM plc", None),
+            ("SELECT resource_name FROM resource", None),
+            ("""
                 SELECT p.plc_name, r.resource_name 
                 FROM plc p
                 JOIN resource_bit rb ON p.plc_id = rb.plc_id
                 JOIN resource r ON rb.resource_id = r.resource_id
                 GROUP BY p.plc_name, r.resource_name
-            """)
-            for record in records:
-                db_plc_resources.add((record['plc_name'], record['resource_name']))
+            """, None)
+        ], as_tuples=True)
+
+        # Rows are (column, ...) tuples, so sets are built without a dictionary per row
+        db_plcs = {plc_name for (plc_name,) in plc_records}
+        db_resources = {resource_name for (resource_name,) in resource_records}
+
+        # Existing (plc_name, resource_name) pairs to identify removed combinations
+        db_plc_resources = set(plc_resource_records)
 
+        # Borrow a pooled async connection; all removals are committed together when the block ends
+        async with self.db_connection.transaction() as conn:
             # Find removed PLC-resource combinations and completely removed PLCs
             removed_plc_resources = db_plc_resources - self.plc_resources
             removed_plcs = db_plcs - self.yaml_plcs
@@ -120,31 +116,33 @@ class PLCResourceSync:
             # Clean up local files BEFORE database cleanup
             self._cleanup_local_files(removed_plc_resources, removed_plcs)
 
-            # Database cleanup (existing code)
+            # Database cleanup, one executemany call per statement instead of one execute per row
             for plc_name, resource_name in removed_plc_resources:
                 print(f"Removing PLC-resource combination: {plc_name}-{resource_name}")
-                await conn.execute(
-                    "EXEC delete_plc_resource_bits :plc_name, :resource_name", 
-                    {"plc_name": plc_name, "resource_name": resource_name}
-                )
+            await conn.executemany(
+                "EXEC delete_plc_resource_bits :plc_name, :resource_name",
+                [{"plc_name": plc_name, "resource_name": resource_name}
+                 for plc_name, resource_name in removed_plc_resources]
+            )
 
-            # Delete PLCs that are in DB but not in YAML
+            # Delete PLCs that are in DB but not in YAML (their bits first)
             for plc_name in removed_plcs:
                 print(f"Removing PLC: {plc_name}")
-                await conn.execute("EXEC delete_plc_all_bits :plc_name", {"plc_name": plc_name})
-                await conn.execute("DELETE FROM plc WHERE plc_name = :plc_name", {"plc_name": plc_name})
+            removed_plc_parameters = [{"plc_name": plc_name} for plc_name in removed_plcs]
+            await conn.executemany("EXEC delete_plc_all_bits :plc_name", removed_plc_parameters)
+            await conn.executemany("DELETE FROM plc WHERE plc_name = :plc_name", removed_plc_parameters)
 
             # Delete resources that are in DB but not in YAML (optional)
-            for resource_name in db_resources - self.yaml_resources:
-                await conn.execute("DELETE FROM resource WHERE resource_name = :resource_name", {"resource_name": resource_name})
+            await conn.executemany(
+                "DELETE FROM resource WHERE resource_name = :resource_name",
+                [{"resource_name": resource_name} for resource_name in db_resources - self.yaml_resources]
+            )
 
             # REMOVED: Manual INSERT statements for PLCs and resources
             # Let the upsert_plc_bits procedure handle creating them when needed
 
             print(f"Sync completed. YAML has {len(self.yaml_plcs)} PLCs and {len(self.yaml_resources)} resources")
 
-        finally:
-            await conn.disconnect()
 
 if __name__ == "__main__":
     from Forceringen.config.config_path import config_path
@@ -17,6 +17,7 @@ from Forceringen.util.config_manager import ConfigLoader
 from Forceringen.PLC.convert_dat_file import DataProcessor, FileReader
 from Forceringen.PLC.Search_Access import DatabaseSearcher
 import asyncio
+import contextvars
 import threading
 from sqlalchemy import text
 
@@ -36,7 +37,7 @@ class BitConversionDBWriter(BitConversion):
     Author: CHIV
     """
 
-    def __init__(self, data_list, config_loader):
+    def __init__(self, data_list, config_loader, already_converted=False):
         """
         Information:
             Initialize with data list and ConfigLoader instance.
@@ -45,19 +46,25 @@ class BitConversionDBWriter(BitConversion):
         Parameters:
             Input: data_list - List of bit data to convert and write
                   config_loader - Instance of ConfigLoader containing DB info
+                  already_converted - True when data_list already went through
+                                      convert_variable_list(), so it is written as is
 
         Date: 03/06/2025
         Author: CHIV
         """
         super().__init__(data_list)
         self.config_loader = config_loader
+        self.already_converted = already_converted
         self.repo = PLCBitRepositoryAsync(config_loader)
         self.db_connection = DatabaseConnection(config_loader)
 
     async def write_to_database(self):
         """
         Information:
-            Asynchronously write the converted bit data to the database using a single batch procedure.
+            Asynchronously write the converted bit data to the database.
+            The records are grouped per PLC and resource, and every group is passed to the
+            batch procedure in a transaction of its own, so a group that fails is rolled back
+            without losing the groups written before or after it.
             Sets force_active=TRUE for the given entries and force_active=FALSE for others
             with the same PLC and resource.
             Uses a stored procedure to handle the database operations efficiently.
@@ -65,80 +72,81 @@ class BitConversionDBWriter(BitConversion):
         Date: 03/06/2025
         Author: CHIV
         """
-        processed_list = self.convert_variable_list()
+        processed_list = self.data_list if self.already_converted else self.convert_variable_list()
         if not processed_list:
             print("No data to process")
             return
-        
-        # Get PLC and resource from first record (assuming all records have same PLC/resource)
-        plc_name = processed_list[0].get("PLC")
-        resource_name = processed_list[0].get("resource")
-        bit_name = processed_list[0].get("name_id")
-
-        print(f"PLC: {plc_name}, Resource: {resource_name}")
-        if not plc_name or not resource_name:
-            print("Error: Missing PLC or resource name in data")
-            return
-        elif plc_name and resource_name and not bit_name:
-            processed_list = []
-            bits_json = json.dumps(processed_list)
-        else:
-            bits_json = json.dumps(processed_list)
-        
-        # Get async connection using the unified DatabaseConnection
-        conn = await self.db_connection.get_connection(is_async=True)
-        try:
-            print(f"Processing {len(processed_list)} bits for PLC: {plc_name}, Resource: {resource_name}")
-
-            # Use the unified execute method instead of sync_connection.execute
-            result = await conn.execute(
-                "EXEC upsert_plc_bits :plc_name, :resource_name, :bits_data",
-                {
-                    "plc_name": plc_name,
-                    "resource_name": resource_name,
-                    "bits_data": bits_json
-                }
-            )
 
+        # Group the records per PLC/resource, keeping the order of the files
+        grouped_records = {}
+        for record in processed_list:
+            grouped_records.setdefault((record.get("PLC"), record.get("resource")), []).append(record)
+
+        failed_groups = 0
+        for (plc_name, resource_name), records in grouped_records.items():
+            print(f"PLC: {plc_name}, Resource: {resource_name}")
+            if not plc_name or not resource_name:
+                print("Error: Missing PLC or resource name in data")
+                continue
+
+            # A resource without forcings only carries a record without name_id
+            if not records[0].get("name_id"):
+                records = []
+            bits_json = json.dumps(records)
+
+            print(f"Processing {len(records)} bits for PLC: {plc_name}, Resource: {resource_name}")
+            try:
+                # One pooled connection and one transaction per resource, committed when the block ends
+                async with self.db_connection.transaction() as conn:
+                    await conn.execute(
+                        "EXEC upsert_plc_bits :plc_name, :resource_name, :bits_data",
+                        {
+                            "plc_name": plc_name,
+                            "resource_name": resource_name,
+                            "bits_data": bits_json
+                        }
+                    )
+            except Exception as e:
+                failed_groups += 1
+                print(f"Database error for PLC: {plc_name}, Resource: {resource_name}: {e}")
+
+        if failed_groups:
+            print(f"Procedure failed for {failed_groups} of {len(grouped_records)} resources, the others were saved.")
+        else:
             print(f"✅ Procedure executed successfully.")
 
-        except Exception as e:
-            print(f"Database error: {e}")
-        finally:
-            await conn.disconnect()
+    def write_to_database_sync(self):
+        """
+        Information:
+            Run the database write operation to completion from synchronous code.
+            Creates a new event loop for the current thread and closes it afterwards,
+            so it must not be called from a thread that already runs an event loop.
+
+        Date: 16/10/2026
+        Author: CHIV
+        """
+        async def write_and_close_pools():
+            try:
+                await self.write_to_database()
+            finally:
+                # The event loop ends here, so its pooled connections are closed as well
+                await DatabaseConnection.close_pools()
+
+        asyncio.run(write_and_close_pools())
 
     def write_to_database_threaded(self):
         """
         Information:
             Run the database write operation in a separate thread.
-            This avoids event loop conflicts when running in GUI contexts.
-            Creates a new event loop for the thread and manages its lifecycle.
+            This avoids event loop conflicts when running in GUI contexts,
+            where the calling thread already runs an event loop.
 
         Date: 03/06/2025
         Author: CHIV
         """
-        
-        def run_async_in_thread():
-            """
-            Information:
-                Inner function to run in a separate thread.
-                Creates and manages an event loop for asynchronous operations.
-
-            Date: 03/06/2025
-            Author: CHIV
-            """
-            # Create a new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                # Run the async database operation to completion
-                return loop.run_until_complete(self.write_to_database())
-            finally:
-                loop.close()
-        
-        # Create and start a thread for the database operation
-        thread = threading.Thread(target=run_async_in_thread)
+        # Create and start a thread for the database operation, in a copy of the caller's
+        # context so context-bound state (such as captured GUI output) follows the write
+        thread = threading.Thread(target=contextvars.copy_context().run, args=(self.write_to_database_sync,))
         thread.start()
         
         # Wait for the thread to complete (blocks the calling thread)
@@ -10,6 +10,9 @@ Date: 03/06/2025
 Author: TOVY
 """
 
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
 import pyodbc
 from Forceringen.PLC.convert_dat_file import FileReader, DataProcessor
@@ -28,11 +31,18 @@ class DatabaseSearcher:
     Date: 03/06/2025
     Author: TOVY
     """
+    # Search results shared by all instances, keyed on the query inputs and
+    # the modification time of the Access database (least recently used first)
+    _result_cache = OrderedDict()
+    _result_cache_lock = threading.Lock()  # Searches may run in parallel threads
+    RESULT_CACHE_SIZE = 128
+
     def __init__(self, dbs_path):
         """
         Information:
             Initialize the database searcher with a path to the database file.
             Sets up the connection string but doesn't establish a connection yet.
+            Records the database modification time used to invalidate cached results.
 
         Parameters:
             Input: dbs_path - Path to the Access database file
@@ -46,12 +56,20 @@ class DatabaseSearcher:
             f"DBQ={self.db_path};"
         )
         self.conn = None
+        self.cursor = None
+        self._query_cache = {}  # (query_template, batch length) -> formatted SQL
+        try:
+            self.db_mtime = os.stat(self.db_path).st_mtime_ns
+        except OSError:
+            self.db_mtime = None  # Unknown modification time disables the result cache
 
     def __enter__(self):
         """
         Information:
-            Context management entry method that establishes a database connection.
+            Context management entry method.
             Used when the class is instantiated in a 'with' statement.
+            The database connection is only opened when a query actually has to run,
+            so searches served from the result cache never touch the database.
 
         Parameters:
             Output: Self reference for use in the context manager
@@ -59,9 +77,48 @@ class DatabaseSearcher:
         Date: 03/06/2025
         Author: TOVY
         """
-        self.conn = pyodbc.connect(self.connection_string)
         return self
 
+    def _get_cursor(self):
+        """
+        Information:
+            Return the cursor of the database connection, establishing both on first use.
+            The cursor is reused for every search so pyodbc can reuse the prepared
+            statement when the same SQL is executed again.
+
+        Parameters:
+            Output: pyodbc cursor object
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        if self.conn is None:
+            self.conn = pyodbc.connect(self.connection_string)
+        if self.cursor is None:
+            self.cursor = self.conn.cursor()
+        return self.cursor
+
+    def _get_query(self, query_template, batch_length):
+        """
+        Information:
+            Return the SQL for a batch of the given length, formatting the template
+            only the first time a (template, length) combination is seen.
+
+        Parameters:
+            Input: query_template - SQL query template with {placeholders} for values
+                  batch_length - Number of values in the batch
+            Output: SQL query string with one '?' per value
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        key = (query_template, batch_length)
+        query = self._query_cache.get(key)
+        if query is None:
+            query = query_template.format(placeholders=", ".join("?" * batch_length))
+            self._query_cache[key] = query
+        return query
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Information:
@@ -76,8 +133,12 @@ class DatabaseSearcher:
         Date: 03/06/2025
         Author: TOVY
         """
+        if self.cursor:
+            self.cursor.close()
+            self.cursor = None
         if self.conn:
             self.conn.close()
+            self.conn = None
 
     def search(self, item_list, query_template, department_name, plc, resource):
         """
@@ -85,6 +146,8 @@ class DatabaseSearcher:
             Searches the database with a given query template.
             Processes search results into a standardized dictionary format.
             Uses batch processing to handle large item lists efficiently.
+            Results are cached per (database, query, items, PLC, resource) and reused
+            as long as the Access database file is not modified.
 
         Parameters:
             Input: item_list - List of tuples [(search_name, value, extra_value), ...]
@@ -111,7 +174,20 @@ class DatabaseSearcher:
                 "name_id": None  # This will trigger the empty list logic
             }]
 
-        processed_results = []
+        cache_key = None
+        if self.db_mtime is not None:
+            cache_key = (
+                self.db_path, self.db_mtime, query_template,
+                tuple(tuple(item) for item in item_list),
+                department_name, plc, resource
+            )
+            with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+            if cached is not None:
+                # Callers convert the values in place, so hand out fresh copies
+                return [dict(row) for row in cached]
 
         # Prepare search terms and mapping outside query loop
         search_items = [item[0] for item in item_list]
@@ -120,12 +196,11 @@ class DatabaseSearcher:
         # Batched execution if item_list is very large (optional, Access might not like >1000 in IN)
         batch_size = 800  # safe upper limit for Access SQL
         processed_results = []
-        cursor = self.conn.cursor()
+        cursor = self._get_cursor()
 
         for i in range(0, len(search_items), batch_size):
             batch = search_items[i:i + batch_size]
-            placeholders = ", ".join("?" for _ in batch)
-            query = query_template.format(placeholders=placeholders)
+            query = self._get_query(query_template, len(batch))
             try:
                 cursor.execute(query, batch)
                 results_ = cursor.fetchall()
@@ -153,7 +228,14 @@ class DatabaseSearcher:
                     })
             except pyodbc.Error as e:
                 print(f"Database query error: {e}")
+                cache_key = None  # Never cache incomplete results
                 continue  # Try remaining batches
+
+        if cache_key is not None:
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = [dict(row) for row in processed_results]
+                if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
         return processed_results
 
 
@@ -3,6 +3,12 @@ from datetime import datetime
 from Forceringen.PLC.convert_dat_file import DataProcessor, FileReader
 from Forceringen.PLC.Search_Access import DatabaseSearcher
 
+# Precompiled struct formats used to reinterpret the raw PLC words
+UINT32_STRUCT = struct.Struct('!I')
+FLOAT_STRUCT = struct.Struct('!f')
+UINT64_STRUCT = struct.Struct('>Q')
+DOUBLE_STRUCT = struct.Struct('>d')
+
 
 class BitConversion:
     """
@@ -53,7 +59,7 @@ class BitConversion:
             try:
                 if type_ == 'REAL' and value:
                     int_value = int(value[0], 16)
-                    float_value = struct.unpack('!f', struct.pack('!I', int_value))[0]
+                    float_value = FLOAT_STRUCT.unpack(UINT32_STRUCT.pack(int_value))[0]
                     sublist["Value"] = str(float_value)
 
                 elif type_ == 'LINT' and value:
@@ -62,7 +68,7 @@ class BitConversion:
                 elif type_ == 'DOUBLE' and value:
                     hex_combined = ''.join(value[::-1])
                     int_value = int(hex_combined, 16)
-                    double_precision_float = struct.unpack('>d', struct.pack('>Q', int_value))[0]
+                    double_precision_float = DOUBLE_STRUCT.unpack(UINT64_STRUCT.pack(int_value))[0]
                     sublist["Value"] = str(double_precision_float)
 
                 elif type_ == 'BOOL':
@@ -38,8 +38,8 @@ class FileReader:
         Author: TOVY
         """
         with open(self.filename, "r") as f:
-            lines = f.readlines()
-        return [line.split() for line in lines if line.strip()]  # Ignore empty lines
+            # Split each line once while streaming; blank lines split to an empty list
+            return [words for words in map(str.split, f) if words]
 
 
 class DataProcessor:
@@ -76,6 +76,8 @@ class SFTPClient:
         Information:
             Download a remote file to a local path.
             Creates the necessary directories if they don't exist.
+            Skips the transfer when the local copy has the same size and modification
+            time as the remote file; downloaded files get the remote modification time.
             Provides feedback on download status.
 
         Parameters:
@@ -90,7 +92,20 @@ class SFTPClient:
             return
         os.makedirs(os.path.dirname(local_file), exist_ok=True)
         try:
+            remote_stat = self.sftp.stat(remote_file)
+            try:
+                local_stat = os.stat(local_file)
+                if (local_stat.st_size == remote_stat.st_size
+                        and int(local_stat.st_mtime) == remote_stat.st_mtime):
+                    print(f"Unchanged {remote_file}, skipping download")
+                    return
+            except FileNotFoundError:
+                pass
+
             self.sftp.get(remote_file, local_file)
+            # Keep the remote mtime so the next run can detect unchanged files
+            if remote_stat.st_mtime is not None:
+                os.utime(local_file, (remote_stat.st_mtime, remote_stat.st_mtime))
             print(f"Downloaded {remote_file} → {local_file}")
         except Exception as e:
             print(f"Error downloading {remote_file}: {e}")
@@ -1,4 +1,3 @@
-
 """
 PLC Management and Monitoring Shiny Application
 
@@ -16,7 +15,7 @@ from shiny import App, ui, render, reactive
 from Forceringen.ui.ui_components import (
     create_app_ui, create_resource_buttons_ui,
     create_resource_table, create_plc_table, create_detail_view,
-    create_config_view, create_output_view
+    create_config_view, create_output_view, STATIC_ASSETS_DIR
 )
 from Forceringen.util.server_functions import (
     run_distributor_and_capture_output, validate_yaml, update_configuration,
@@ -25,8 +24,19 @@ from Forceringen.util.server_functions import (
     create_detail_click_handler, create_save_reason_handler,
     create_back_button_handler
 )
+from Forceringen.util.unified_db_connection import DatabaseConnection
+import asyncio
+import io
+import logging
 import os
 
+# Handler diagnostics are logged at debug level; only warnings and errors are shown by default
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+# Seconds between refreshes of the terminal output while the distributor is running
+OUTPUT_REFRESH_INTERVAL = 0.5
+
 try:
     config_loader = config_path.create_config_loader()
     config = config_loader.config  # Store for backward compatibility
@@ -67,6 +77,7 @@ def server(inputs, outputs, session):
     save_message = reactive.Value("")
     selected_bit_detail = reactive.Value(None)  # Store selected bit for detail view
     bit_history_data = reactive.Value([])  # Store history data for detail view
+    distributor_output = reactive.Value(None)  # Output buffer of the running distributor
 
     # Reactive value for host options and config
     current_host_options = reactive.Value(config_loader.get_host_options())
@@ -90,26 +101,37 @@ def server(inputs, outputs, session):
             selected=option_keys[0] if option_keys else None
         )
 
+    # Opens the database connection pool in the background; an awaited effect would hold back
+    # the whole page until the database answered, or until the login timed out when it is down
+    @reactive.extended_task
+    async def warmup_task(cfg_loader):
+        return await DatabaseConnection(cfg_loader).warmup()
+
+    # Open the database connection pool while the user is still looking at the start page,
+    # and again for a new database configuration
+    @reactive.effect
+    def warmup_database():
+        warmup_task(current_config_loader())
+
     # View-switching logic
     @reactive.effect
     @reactive.event(inputs.view_output)
     def _():
         selected_view.set("output")
         save_message.set("")
-        print("Selected view is:", selected_view())
+        logger.debug("Selected view is: output")
 
     @reactive.effect
     @reactive.event(inputs.view_config)
     def _():
         selected_view.set("Config")
         save_message.set("")
-        save_message.set("")
         plc_bits_data.set([])
         selected_resource.set(None)
         selected_plc.set(None)
         selected_bit_detail.set(None)
         bit_history_data.set([])
-        print("Selected view is:", selected_view())
+        logger.debug("Selected view is: Config")
 
     @reactive.effect
     @reactive.event(inputs.view_resource)
@@ -128,6 +150,9 @@ def server(inputs, outputs, session):
     def _():
         selected_view.set("detail")
 
+    # Handlers created for the current config, destroyed when the config changes
+    event_handlers = []
+
     # Create event handlers with reactive config - MOVED TO INSIDE EFFECTS
     @reactive.effect
     def setup_event_handlers():
@@ -135,19 +160,12 @@ def server(inputs, outputs, session):
         current_cfg = current_config()
         current_cfg_loader = current_config_loader()
 
-        create_resource_click_handler(
-            current_cfg, inputs, selected_resource, selected_plc, selected_view, plc_bits_data, current_cfg_loader
-        )
-
-        create_plc_click_handler(
-            current_cfg, inputs, selected_plc, selected_resource, selected_view, plc_bits_data, current_cfg_loader
-        )
+        # Without this, every config change would add a second set of handlers
+        # and every click would be handled (and fetched) once per set
+        for handler in event_handlers:
+            handler.destroy()
 
-        create_detail_click_handler(
-            plc_bits_data, inputs, selected_bit_detail, selected_view, bit_history_data, current_cfg_loader, selected_plc
-        )
-
-        create_save_reason_handler(
+        save_reason_handlers = create_save_reason_handler(
             inputs,
             plc_bits_data,
             selected_plc,
@@ -155,24 +173,26 @@ def server(inputs, outputs, session):
             save_message,
             current_cfg_loader,
             selected_bit_detail,
-            bit_history_data
+            bit_history_data,
+            session
         )
 
-        #
-        # create_save_reason_handler(
-        #     inputs,
-        #     plc_bits_data,
-        #     selected_plc,
-        #     selected_resource,
-        #     save_message,
-        #     config_loader,
-        #     selected_bit_detail,  # Voor detail view
-        #     bit_history_data  # Voor detail view
-        # )
-
-        create_back_button_handler(
-            inputs, selected_resource, selected_view, plc_bits_data, current_cfg_loader, selected_plc
-        )
+        event_handlers[:] = [
+            create_resource_click_handler(
+                current_cfg, inputs, selected_resource, selected_plc, selected_view, plc_bits_data, current_cfg_loader
+            ),
+            create_plc_click_handler(
+                current_cfg, inputs, selected_plc, selected_resource, selected_view, plc_bits_data, current_cfg_loader
+            ),
+            create_detail_click_handler(
+                plc_bits_data, inputs, selected_bit_detail, selected_view, bit_history_data, current_cfg_loader,
+                selected_plc
+            ),
+            *save_reason_handlers,
+            create_back_button_handler(
+                inputs, selected_resource, selected_view, plc_bits_data, current_cfg_loader, selected_plc
+            ),
+        ]
 
     @outputs()
     @render.text
@@ -184,42 +204,76 @@ def server(inputs, outputs, session):
     def terminal_output():
         return terminal_text()
 
+    # Runs the distributor in a worker thread, without holding up the reactive flush,
+    # so the terminal output can be refreshed while it runs
+    @reactive.extended_task
+    async def distributor_task(cfg_loader, host_value, buffer):
+        return await asyncio.to_thread(run_distributor_and_capture_output, cfg_loader, host_value, buffer)
+
     @reactive.effect
     @reactive.event(inputs.start_btn)
     def on_start():
         # Switch to output view first
         selected_view.set("output")
 
+        # A run is already going, its output is still being shown
+        if distributor_task.status() == "running":
+            return
+
         # Then run the distributor with current config
-        selected_host_value = inputs.host_select()
-        current_cfg_loader = current_config_loader()
-        captured_output = run_distributor_and_capture_output(current_cfg_loader, selected_host_value)
-        terminal_text.set(captured_output or "[No output produced]")
+        buffer = io.StringIO()
+        distributor_output.set(buffer)
+        distributor_task(current_config_loader(), inputs.host_select(), buffer)
+
+    @reactive.effect
+    def stream_distributor_output():
+        """Show the output of the running distributor as it arrives, and the full output once it is done"""
+        buffer = distributor_output()
+        if buffer is None:
+            return
+        if distributor_task.status() == "running":
+            reactive.invalidate_later(OUTPUT_REFRESH_INTERVAL)
+            terminal_text.set(buffer.getvalue())
+        else:
+            terminal_text.set(buffer.getvalue() or "[No output produced]")
+            distributor_output.set(None)
 
     @outputs()
     @render.ui
     def resource_buttons():
         # Make this output depend on the trigger AND current config
         resource_buttons_trigger()
-        current_cfg = current_config()
+        current_cfg_loader = current_config_loader()
 
-        # Use the current config instead of the global one
-        return create_resource_buttons_ui(current_cfg, inputs, selected_resource, selected_plc)
+        # Use the current config (and its host index) instead of the global one
+        return create_resource_buttons_ui(current_cfg_loader, inputs)
+
+    # Highlight the selected PLC or resource button on the page, without rendering the buttons again
+    @reactive.effect
+    async def highlight_selected_button():
+        if inputs.host_select() == "all":
+            name = selected_plc()
+        else:
+            name = selected_resource()
+        # Compared with the button's data-name attribute, which is always text
+        await session.send_custom_message("select_button", {"name": None if name is None else str(name)})
 
     @outputs()
     @render.ui
     def main_panel():
-        if selected_view() == "output":
+        # Read the view once, every branch compares the same value
+        view = selected_view()
+        if view == "output":
             return create_output_view()
-        elif selected_view() == "Config":
+        elif view == "Config":
             return create_config_view(config_path.get_path())
-        elif selected_view() == "resource":
+        elif view == "resource":
             data = plc_bits_data()
             return create_resource_table(data, selected_resource, selected_plc)
-        elif selected_view() == "ALL":
+        elif view == "ALL":
             data = plc_bits_data()
             return create_plc_table(data, selected_plc)
-        elif selected_view() == "detail":
+        elif view == "detail":
             bit_data = selected_bit_detail()
             history_data = bit_history_data()
             return create_detail_view(bit_data, history_data)
@@ -268,7 +322,8 @@ def server(inputs, outputs, session):
             selected_bit_detail.set(None)
             bit_history_data.set([])
 
-            save_message.set("Configuration saved successfully!")
+            # save_message now holds the outcome of the database sync; it is not overwritten
+            # here, so a failed sync is still reported
 
         except Exception as e:
             save_message.set(f"Error saving file: {str(e)}")
@@ -288,7 +343,7 @@ def server(inputs, outputs, session):
         return ""
 
 
-app = App(app_ui, server)
+app = App(app_ui, server, static_assets=STATIC_ASSETS_DIR)
 
 if __name__ == "__main__":
     from shiny import run_app
@@ -10,61 +10,13 @@ Date: 03/06/2025
 Author: TOVY
 """
 
+import html
+from pathlib import Path
 from shiny import ui
+from Forceringen.util.config_manager import read_yaml_text
 
-COLOR = "#FB4400"
-
-# Better solution - more specific targeting
-enter_key_js = ui.tags.script("""
-document.addEventListener('DOMContentLoaded', function() {
-    // Single delegated event listener for reason inputs only
-    document.addEventListener('keydown', function(event) {
-        const target = event.target;
-        
-        // Only process Enter key on specific reason input fields in data tables/detail view
-        if (event.key !== 'Enter' || 
-            !target.id || 
-            !target.id.startsWith('reason_input_') ||
-            target.type !== 'text' ||
-            target.closest('.data-grid-container, [style*="max-width: 1000px"]') === null) {
-            return;
-        }
-        
-        event.preventDefault();
-        
-        const forcedInput = document.getElementById(
-            target.id.replace('reason_input_', 'forced_input_')
-        );
-        const forcedValue = forcedInput?.value || '';
-        
-        // Get melding value for both detail and table views
-        const meldingInput = document.getElementById(
-            target.id.replace('reason_input_', 'melding_input_')
-        );
-        const meldingValue = meldingInput?.value || '';
-        
-        if (target.id === 'reason_input_detail') {
-            // Handle detail view
-            Shiny.setInputValue('save_reason_detail_triggered', {
-                reasonValue: target.value,
-                forcedValue: forcedValue,
-                meldingValue: meldingValue,
-                timestamp: Date.now()
-            });
-        } else {
-            // Handle table view
-            const index = target.id.split('_')[2];
-            Shiny.setInputValue('save_reason_triggered', {
-                index: index,
-                reasonValue: target.value,
-                forcedValue: forcedValue,
-                meldingValue: meldingValue,  // Add this line!
-                timestamp: Date.now()
-            });
-        }
-    });
-});
-""")
+# Static files of the page (app.css, app.js), served at the root of the app
+STATIC_ASSETS_DIR = Path(__file__).parent / "www"
 
 # Consolidated CSS styles
 TABLE_CSS = """
@@ -103,42 +55,12 @@ input[type="text"]:focus {
     border-collapse: collapse;
     margin: 0;
 }
-"""
-
-# Precompiled button styles
-BUTTON_STYLES = """
-.button {
-    border: none;
-    color: white;
-    padding: 16px 32px;
-    text-align: center;
-    text-decoration: none;
-    display: inline-block;
-    font-size: 16px;
-    margin: 4px 2px;
-    transition-duration: 0.4s;
-    cursor: pointer;
-    font-family: 'VAGRoundedLight';
-    box-shadow:
-    0 8px 32px 4px rgba(0,0,0,0.40),
-    0 2px 8px 1px rgba(0,0,0,0.24),
-    0 0 0 6px rgba(255,56,1,0.12);
-    transition: box-shadow 0.3s;
+@keyframes row-saved {
+    from { background-color: #c8f7c5; }
+    to { background-color: transparent; }
 }
-.button1 {
-    background-color: white;
-    color: black;
-    border: 2px solid #90D5FF;
-    font-family: 'VAGRoundedLight';
-    white-space: nowrap;
-}
-.button1.selected {
-    background-color: #90D5FF;
-    color: white;
-}
-.button1:hover {
-    background-color: #90D5FF;
-    color: white;
+.data-grid tr.row-saved td {
+    animation: row-saved 1.5s ease-out;
 }
 """
 
@@ -155,54 +77,62 @@ def format_value_display(value, default=''):
     """
     return '' if value in (None, 'None') else str(value)
 
-def create_button_with_selection(btn_id, text, is_selected=False, style_override="width:90%; margin-bottom:8px;"):
+def escape_cell_text(value):
+    """
+    Helper function to write a value as the text of a table cell,
+    escaped like the text of a ui.tags.td tag.
+
+    Parameters:
+        value: The value to write, None gives an empty cell
+
+    Returns:
+        Escaped HTML text
     """
-    Helper function to create buttons with consistent styling and selection state.
+    return '' if value is None else html.escape(str(value), quote=False)
+
+def create_button_with_selection(btn_id, text, style_override="width:90%; margin-bottom:8px;"):
+    """
+    Helper function to create buttons with consistent styling that can be selected.
+    The selected class is set on the page by the select_button message (see app.js),
+    matched on the button's data-name, so a new selection needs no re-render.
     
     Parameters:
         btn_id: Button ID
-        text: Button text
-        is_selected: Whether button should have selected class
+        text: Button text, also the name the selection is matched on
         style_override: Custom style string
     
     Returns:
         UI button element
     """
-    class_name = "button button1"
-    if is_selected:
-        class_name += " selected"
-    
     return ui.input_action_button(
         btn_id, text,
         class_="button button1",
-        style=style_override
+        style=style_override,
+        **{"data-name": text}
     )
 
-def create_resource_buttons_ui(config, inputs, selected_resource, selected_plc):
+def create_resource_buttons_ui(config_loader, inputs):
     """
-    Creates UI buttons for PLC resources based on the current selection.
+    Creates UI buttons for PLC resources based on the selected host.
     Optimized with helper functions and reduced repetition.
+    The selected host is looked up in the config loader's host index.
+    The buttons do not depend on the selected PLC or resource, see create_button_with_selection.
     """
     selected_hosts = inputs.host_select()
-    sftp_hosts = config.get('sftp_hosts', [])
+    sftp_hosts = config_loader.get_sftp_hosts()
 
     if not selected_hosts or selected_hosts == "all":
         if not sftp_hosts:
             return ui.tags.p("No PLCs found.")
         
         plc_buttons = [
-            create_button_with_selection(
-                f"plc_{i}",
-                host.get('hostname', host.get('ip_address')),
-                selected_plc() == host.get('hostname', host.get('ip_address'))
-            )
+            create_button_with_selection(f"plc_{i}", host.get('hostname', host.get('ip_address')))
             for i, host in enumerate(sftp_hosts)
         ]
         return ui.tags.div(*plc_buttons)
 
-    host_cfg = next((host for host in sftp_hosts
-                     if host.get('hostname') == selected_hosts or host.get('ip_address') == selected_hosts), None)
-    
+    host_cfg = config_loader.get_host(selected_hosts)
+
     if not host_cfg:
         return ui.tags.p("No resources found for this PLC.")
 
@@ -211,21 +141,30 @@ def create_resource_buttons_ui(config, inputs, selected_resource, selected_plc):
         return ui.tags.p("No resources found for this PLC.")
 
     buttons = [
-        create_button_with_selection(
-            f"resource_{i}",
-            resource,
-            selected_resource() == resource
-        )
+        create_button_with_selection(f"resource_{i}", resource)
         for i, resource in enumerate(resources)
     ]
     
     return ui.tags.div(*buttons)
 
+# Static UI fragments, built once and shared by every render
+TABLE_STYLE_TAG = ui.tags.style(TABLE_CSS)
+
+OUTPUT_VIEW = ui.tags.div(
+    ui.output_text("selected_host"),
+    ui.tags.h2("Output"),
+    ui.output_text_verbatim("terminal_output", placeholder=True)
+)
+
+# Configuration view per YAML path: path -> (file text, view)
+_config_views = {}
+
 def create_table_css():
     """
     Returns optimized CSS styling as a single style tag.
+    The tag is built once at import.
     """
-    return ui.tags.style(TABLE_CSS)
+    return TABLE_STYLE_TAG
 
 def create_table_header(headers):
     """
@@ -240,6 +179,27 @@ def create_table_header(headers):
     header_cells = [ui.tags.th(header) for header in headers]
     return ui.tags.tr(*header_cells)
 
+# Element ids per row number, built once and extended when a larger table is shown:
+# (forced_input, melding_input, reason_input, detail_btn, bit_row)
+_row_ids = []
+
+def get_row_ids(index):
+    """
+    Helper function to get the element ids of a table row.
+
+    Parameters:
+        index: Row index
+
+    Returns:
+        Tuple (forced input id, melding input id, reason input id, detail button id, row id)
+    """
+    if index >= len(_row_ids):
+        _row_ids.extend(
+            (f"forced_input_{i}", f"melding_input_{i}", f"reason_input_{i}", f"detail_btn_{i}", f"bit_row_{i}")
+            for i in range(len(_row_ids), index + 1)
+        )
+    return _row_ids[index]
+
 def create_table_row(item, index, include_reason_inputs=True, include_resource=False):
     """
     Helper function to create table rows with consistent formatting.
@@ -253,58 +213,60 @@ def create_table_row(item, index, include_reason_inputs=True, include_resource=F
     Returns:
         Table row element
     """
-    # Format datetime
-    forced_at = item.get('forced_at')
-    forced_at_str = forced_at.strftime("%d-%m-%Y") if forced_at else ""
-    
-    # Format values
-    comment = format_value_display(item.get('comment', ''))
-    second_comment = format_value_display(item.get('second_comment', ''))
-    forced_by = format_value_display(item.get('forced_by', ''))
-    melding = format_value_display(item.get('melding', ''))
-    reason = format_value_display(item.get('reason', ''))
-    
+    # Hoisted lookups: this runs once per row of tables with hundreds of rows
+    get = item.get
+    td = ui.tags.td
+    clean = format_value_display
+    forced_id, melding_id, reason_id, detail_id, row_id = get_row_ids(index)
+
+    # Date formatted by the database (NULL when not forced)
+    forced_at_str = get('forced_at_date') or ""
+    forced_by = clean(get('forced_by', ''))
+
     # Create row class
-    row_class = "force-active" if item.get('force_active') else ""
-    
-    # Base cells
-    cells = []
-    
-    # Add resource column if needed
-    if include_resource:
-        cells.append(ui.tags.td(item.get('resource', '')))
-    
-    # Common cells
-    cells.extend([
-        ui.tags.td(item.get('bit_number', '')),
-        ui.tags.td(item.get('kks', '')),
-        ui.tags.td(comment),
-        ui.tags.td(second_comment),
-        ui.tags.td(item.get('value', '')),
-        ui.tags.td(forced_at_str),
-    ])
-    
+    row_class = "force-active" if get('force_active') else ""
+
+    # Read-only cells: resource column if needed, then the common cells
+    texts = [get('resource', '')] if include_resource else []
+    texts += [
+        get('bit_number', ''),
+        get('kks', ''),
+        clean(get('comment', '')),
+        clean(get('second_comment', '')),
+        get('value', ''),
+        forced_at_str,
+    ]
+    if not include_reason_inputs:
+        texts.append(forced_by)
+
+    # The read-only cells are written as one HTML string instead of a td tag per cell
+    cells = [ui.HTML("<td>" + "</td><td>".join(map(escape_cell_text, texts)) + "</td>")]
+
     # Add input fields if needed
     if include_reason_inputs:
-        cells.extend([
-            ui.tags.td(ui.input_text(f"forced_input_{index}", "", value=forced_by, placeholder="Enter user...")),
-            ui.tags.td(ui.input_text(f"melding_input_{index}", "", value=melding, placeholder="Enter user...")),
-            ui.tags.td(ui.input_text(f"reason_input_{index}", "", value=reason, placeholder="Enter reason...")),
-        ])
-    else:
-        cells.append(ui.tags.td(forced_by))
-    
+        input_text = ui.input_text
+        cells += [
+            td(input_text(forced_id, "", value=forced_by, placeholder="Enter user...")),
+            td(input_text(melding_id, "", value=clean(get('melding', '')), placeholder="Enter user...")),
+            td(input_text(reason_id, "", value=clean(get('reason', '')), placeholder="Enter reason...")),
+        ]
+
     # Add detail button
     cells.append(
-        ui.tags.td(ui.input_action_button(
-            f"detail_btn_{index}",
+        td(ui.input_action_button(
+            detail_id,
             "View Details",
             class_="btn btn-primary btn-sm",
             style="padding: 4px 8px; font-size: 12px;"
         ))
     )
-    
-    return ui.tags.tr(*cells, class_=row_class, id=f"bit_row_{index}")
+
+    # The row's identity, sent along with a reason save so the server never has to
+    # resolve the row number against a table that was replaced in the meantime
+    return ui.tags.tr(
+        *cells, class_=row_class, id=row_id,
+        data_plc=get('PLC', ''), data_resource=get('resource', ''), data_bit=get('bit_number', '')
+    )
 
 def create_resource_table(data, selected_resource, selected_plc):
     """
@@ -530,12 +492,15 @@ def create_detail_view(bit_data, history_data):
 def create_config_view(yaml_path):
     """
     Creates the configuration editing view.
-    Optimized file reading with context manager.
+    The file text comes from the YAML cache, so it is only read again after it changed,
+    and the view is only rebuilt when that text differs from the last build.
     """
-    with open(yaml_path, "r") as file:
-        yaml_content = file.read()
+    yaml_content = read_yaml_text(yaml_path)
+    cached = _config_views.get(yaml_path)
+    if cached and cached[0] == yaml_content:
+        return cached[1]
 
-    return ui.tags.div(
+    view = ui.tags.div(
         ui.tags.h2("PLC Configuration"),
         ui.tags.div(
             ui.tags.label(
@@ -569,145 +534,36 @@ def create_config_view(yaml_path):
         ),
         style="width: 600px; margin: 0 auto; text-align: center;"
     )
+    _config_views[yaml_path] = (yaml_content, view)
+    return view
 
 def create_output_view():
     """
     Creates the output view for displaying terminal output.
+    The view is static and built once at import.
     """
-    return ui.tags.div(
-        ui.output_text("selected_host"),
-        ui.tags.h2("Output"),
-        ui.output_text_verbatim("terminal_output", placeholder=True)
-    )
+    return OUTPUT_VIEW
 
 def create_app_ui(host_options):
     """
     Creates the main application UI with all components.
-    Optimized CSS consolidation and reduced inline styles.
+    The page styles and scripts are served as static files from the www folder,
+    see STATIC_ASSETS_DIR.
     """
-    # Consolidated font and main styles
-    MAIN_STYLES = f"""
-    @font-face {{
-        font-family: 'VAGRoundedLight';
-        src: local('VAG Rounded Light'), local('VAGRoundedLight');
-        font-weight: 300;
-        font-style: normal;
-    }}
-    body, .sidebar, .main-panel, .sidebar-toggle, .button, .button1, h1, h2, select, label, p {{
-        font-family: 'VAGRoundedLight', 'VAG Rounded Light', 'Arial Rounded MT Bold', Arial, sans-serif !important;
-    }}
-    .sidebar {{
-        background: {COLOR};
-        padding: 20px;
-        color: white;
-        height: calc(100vh - 70px);
-        width: 220px;
-        box-sizing: border-box;
-        position: fixed;
-        top: 70px;
-        left: 0;
-        transition: transform 0.2s cubic-bezier(.42,0,.58,1);
-        text-align: center;
-        z-index: 110;
-        overflow-y: auto;
-    }}
-    .sidebar.collapsed {{
-        transform: translateX(-220px);
-    }}
-    .sidebar-content {{
-        display: flex;
-        flex-direction: column;
-        min-height: 100%;
-    }}
-    .sidebar-top {{
-        flex: 1;
-    }}
-    .sidebar-bottom {{
-        margin-top: 20px;
-        padding-top: 10px;
-        border-top: 1px solid rgba(255,255,255,0.2);
-        padding-bottom: 20px;
-    }}
-    .main-panel {{
-        margin-left: 240px;
-        padding: 90px 30px 30px 30px;
-        transition: margin-left 0.2s cubic-bezier(.42,0,.58,1);
-    }}
-    .sidebar.collapsed + .main-panel {{
-        margin-left: 20px;
-    }}
-    .sidebar-toggle {{
-        position: fixed;
-        left: 10px;
-        top: 20px;
-        z-index: 120;
-        background-color: {COLOR};
-        color: white;
-        border: none;
-        border-radius: 50%;
-        width: 36px;
-        height: 36px;
-        cursor: pointer;
-        font-size: 18px;
-        outline: none;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        box-shadow:
-        0 4px 12px 2px rgba(0,0,0,0.18),
-        0 1px 4px 0 rgba(0,0,0,0.10),
-        0 0 0 3px rgba(255,56,1,0.10);
-        transition: box-shadow 0.3s;
-    }}
-    #host_select-label, select#host_select {{
-        font-size: 1.25rem;
-        padding: 10px;
-        height: 48px;
-        width: 90%;
-        font-family: 'VAGRoundedLight';
-    }}
-    h1 {{
-        text-shadow:
-            0 4px 24px rgba(0,0,0,0.45),
-            0 1.5px 0 rgba(0,0,0,0.28),
-            0 0 12px {COLOR}55;
-    }}
-    """
-
-    # Consolidated sidebar toggle JavaScript
-    SIDEBAR_JS = """
-    document.addEventListener("DOMContentLoaded", function() {
-        const sidebar = document.getElementById("sidebar");
-        const toggleBtn = document.getElementById("sidebarToggle");
-        
-        toggleBtn.addEventListener("click", function() {
-            sidebar.classList.toggle("collapsed");
-        });
-    });
-    """
-
     return ui.tags.div(
-        # All CSS in one place
-        ui.tags.style(MAIN_STYLES),
-        ui.tags.style(BUTTON_STYLES),
-        
+        # Styles and scripts are static files (www/), cached by the browser
+        ui.head_content(
+            ui.tags.link(rel="stylesheet", href="app.css"),
+            ui.tags.script(src="app.js")
+        ),
+
         # Top bar
         ui.tags.div(
             ui.tags.h1(
                 "PLC Overrides",
                 style="margin: 0; color: white; font-size: 2rem; text-align: center;"
             ),
-            style=f"""
-                width: 100vw;
-                background: {COLOR};
-                color: white;
-                padding: 0; margin: 0;
-                box-sizing: border-box;
-                position: fixed; top: 0; left: 0;
-                height: 70px;
-                display: flex; justify-content: center; align-items: center;
-                z-index: 100;
-            """
+            class_="top-bar"
         ),
         
         # Sidebar toggle button
@@ -754,8 +610,5 @@ def create_app_ui(host_options):
             style="display: flex; flex-direction: row;"
         ),
         
-        # JavaScript
-        ui.tags.script(SIDEBAR_JS),
-        enter_key_js,
         style="box-sizing: border-box; margin: 0; padding: 0;"
     )
\ No newline at end of file
@@ -0,0 +1,180 @@
+// Sidebar toggle
+document.addEventListener("DOMContentLoaded", function() {
+    const sidebar = document.getElementById("sidebar");
+    const toggleBtn = document.getElementById("sidebarToggle");
+
+    toggleBtn.addEventListener("click", function() {
+        sidebar.classList.toggle("collapsed");
+    });
+});
+
+// Enter key in the reason inputs saves the reason
+document.addEventListener('DOMContentLoaded', function() {
+    // Pending saves; repeated Enter presses within the delay are collapsed into
+    // a single save of the latest values. Table rows are sent together as one batch
+    const SAVE_DELAY_MS = 300;
+    let detailTimer = null;
+    let tableTimer = null;
+    let pendingDetail = null;
+    let pendingRows = {};
+
+    function sendDetail() {
+        clearTimeout(detailTimer);
+        detailTimer = null;
+        if (pendingDetail) {
+            Shiny.setInputValue('save_reason_detail_triggered', pendingDetail, {priority: 'event'});
+            pendingDetail = null;
+        }
+    }
+
+    function sendTableRows() {
+        clearTimeout(tableTimer);
+        tableTimer = null;
+        const rows = Object.values(pendingRows);
+        pendingRows = {};
+        if (rows.length) {
+            Shiny.setInputValue('save_reason_triggered', {
+                rows: rows,
+                timestamp: Date.now()
+            }, {priority: 'event'});
+        }
+    }
+
+    function saveDetail(value) {
+        pendingDetail = value;
+        clearTimeout(detailTimer);
+        detailTimer = setTimeout(sendDetail, SAVE_DELAY_MS);
+    }
+
+    function queueTableRow(row) {
+        pendingRows[row.plc + '\n' + row.resource + '\n' + row.bitNumber] = row;
+        clearTimeout(tableTimer);
+        tableTimer = setTimeout(sendTableRows, SAVE_DELAY_MS);
+    }
+
+    // Saves still waiting for the delay are sent right away when the page is left or
+    // another view is opened, instead of being lost with the page or the detail view
+    function flushPendingSaves() {
+        sendDetail();
+        sendTableRows();
+    }
+
+    window.addEventListener('beforeunload', flushPendingSaves);
+
+    // Capture phase, so the saves are sent before the click itself is handled
+    document.addEventListener('click', function(event) {
+        const button = event.target.closest('button');
+        if (button && /^((plc|resource|detail_btn)_\d+|back_to_list|start_btn|view_\w+)$/.test(button.id)) {
+            flushPendingSaves();
+        }
+    }, true);
+
+    // Single delegated event listener for reason inputs only
+    document.addEventListener('keydown', function(event) {
+        const target = event.target;
+        
+        // Only process Enter key on specific reason input fields in data tables/detail view
+        if (event.key !== 'Enter' || 
+            !target.id || 
+            !target.id.startsWith('reason_input_') ||
+            target.type !== 'text' ||
+            target.closest('.data-grid-container, [style*="max-width: 1000px"]') === null) {
+            return;
+        }
+        
+        event.preventDefault();
+        
+        const forcedInput = document.getElementById(
+            target.id.replace('reason_input_', 'forced_input_')
+        );
+        const forcedValue = forcedInput?.value || '';
+        
+        // Get melding value for both detail and table views
+        const meldingInput = document.getElementById(
+            target.id.replace('reason_input_', 'melding_input_')
+        );
+        const meldingValue = meldingInput?.value || '';
+        
+        if (target.id === 'reason_input_detail') {
+            // Handle detail view
+            saveDetail({
+                reasonValue: target.value,
+                forcedValue: forcedValue,
+                meldingValue: meldingValue,
+                timestamp: Date.now()
+            });
+        } else {
+            // Handle table view; the row is identified by its PLC, resource and bit,
+            // the table may show another resource by the time the save is sent
+            const tableRow = target.closest('tr');
+            if (!tableRow) {
+                return;
+            }
+            queueTableRow({
+                plc: tableRow.dataset.plc,
+                resource: tableRow.dataset.resource,
+                bitNumber: tableRow.dataset.bit,
+                reasonValue: target.value,
+                forcedValue: forcedValue,
+                meldingValue: meldingValue
+            });
+        }
+    });
+});
+
+// Highlight the table rows whose reasons the server saved
+document.addEventListener('DOMContentLoaded', function() {
+    Shiny.addCustomMessageHandler('flash_row', function(message) {
+        // Rows are matched on their PLC, resource and bit, not on their position in the table
+        const saved = new Set(message.rows.map(function(row) {
+            return row.plc + '\n' + row.resource + '\n' + row.bit;
+        }));
+        document.querySelectorAll('tr[data-bit]').forEach(function(row) {
+            if (!saved.has(row.dataset.plc + '\n' + row.dataset.resource + '\n' + row.dataset.bit)) {
+                return;
+            }
+            row.classList.remove('row-saved');
+            void row.offsetWidth;  // restart the animation when the row flashes again
+            row.classList.add('row-saved');
+        });
+    });
+});
+
+// Highlight the selected PLC or resource button; the selection is applied again
+// whenever the buttons are rendered again
+document.addEventListener('DOMContentLoaded', function() {
+    let selectedName = null;
+
+    function markSelected() {
+        document.querySelectorAll('#resource_buttons button[data-name]').forEach(function(button) {
+            button.classList.toggle('selected', button.dataset.name === selectedName);
+        });
+    }
+
+    Shiny.addCustomMessageHandler('select_button', function(message) {
+        selectedName = message.name;
+        markSelected();
+    });
+
+    $(document).on('shiny:value', function(event) {
+        if (event.name === 'resource_buttons') {
+            // The new buttons are in the page once this event has been handled
+            setTimeout(markSelected, 0);
+        }
+    });
+});
+
+// Single delegated click listener for the PLC, resource and detail buttons: a click sends
+// plc_clicked / resource_clicked / detail_btn_clicked with the button number, so the server
+// listens to one input per button kind instead of reading every button's click count
+document.addEventListener('click', function(event) {
+    const button = event.target.closest('button');
+    const match = button && button.id.match(/^(plc|resource|detail_btn)_(\d+)$/);
+    if (!match) {
+        return;
+    }
+    Shiny.setInputValue(match[1] + '_clicked', {
+        index: Number(match[2]),
+        timestamp: Date.now()
+    }, {priority: 'event'});
+});
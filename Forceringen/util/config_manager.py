@@ -1,4 +1,116 @@
+import os
+import copy
 import yaml
+from collections import OrderedDict
+
+# libyaml's C loader parses several times faster than the pure Python one,
+# PyYAML without libyaml falls back to the latter
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+# Parsed YAML files, least recently used first:
+# absolute path -> (mtime_ns, size, parsed configuration, file text)
+YAML_CACHE_SIZE = 100
+_yaml_cache = OrderedDict()
+
+
+def _yaml_cache_entry(yaml_path):
+    """
+    Information:
+        Return the cache entry of a YAML file, reading and parsing the file
+        only when its modification time or size changed since it was cached.
+
+    Parameters:
+        Input: yaml_path - Path to the YAML file
+        Output: Tuple (mtime_ns, size, parsed configuration, file text), not to be modified
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    path = os.path.abspath(yaml_path)
+    file_stat = os.stat(path)
+    entry = _yaml_cache.get(path)
+    if entry and entry[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+        _yaml_cache.move_to_end(path)
+        return entry
+
+    with open(path, "r") as f:
+        yaml_text = f.read()
+    return _cache_yaml(path, parse_yaml(yaml_text), yaml_text)
+
+
+def _cache_yaml(yaml_path, config, yaml_text):
+    """
+    Information:
+        Store the parsed configuration and text of a YAML file in the cache,
+        keyed on the file's current modification time and size.
+
+    Parameters:
+        Input: yaml_path - Path to the YAML file
+              config - Parsed configuration, owned by the cache from now on
+              yaml_text - Text of the file
+        Output: The new cache entry
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    path = os.path.abspath(yaml_path)
+    file_stat = os.stat(path)
+    entry = (file_stat.st_mtime_ns, file_stat.st_size, config, yaml_text)
+    _yaml_cache[path] = entry
+    _yaml_cache.move_to_end(path)
+    while len(_yaml_cache) > YAML_CACHE_SIZE:
+        _yaml_cache.popitem(last=False)
+    return entry
+
+
+def parse_yaml(yaml_text):
+    """
+    Information:
+        Parse YAML text like yaml.safe_load, with the C loader when it is available.
+
+    Parameters:
+        Input: yaml_text - String containing YAML content
+        Output: Parsed configuration
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    return yaml.load(yaml_text, Loader=YamlSafeLoader)
+
+
+def load_yaml_config(yaml_path):
+    """
+    Information:
+        Load a YAML configuration file through the cache.
+        Returns a deep copy, so changes by the caller never reach the cache.
+
+    Parameters:
+        Input: yaml_path - Path to the YAML file
+        Output: Parsed configuration
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    return copy.deepcopy(_yaml_cache_entry(yaml_path)[2])
+
+
+def read_yaml_text(yaml_path):
+    """
+    Information:
+        Read the text of a YAML configuration file through the cache.
+
+    Parameters:
+        Input: yaml_path - Path to the YAML file
+        Output: Text of the file
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    return _yaml_cache_entry(yaml_path)[3]
+
 
 class ConfigLoader:
     """
@@ -16,7 +128,8 @@ class ConfigLoader:
         """
         Information:
             Initialize the ConfigLoader with a YAML configuration file path.
-            Loads the configuration upon initialization.
+            Loads the configuration upon initialization, parsing the file
+            only when it changed since it was last loaded.
 
         Parameters:
             Input: yaml_path - Path to the YAML configuration file
@@ -25,8 +138,67 @@ class ConfigLoader:
         Author: TOVY
         """
         self.yaml_path = yaml_path  # Store the path for later use
-        with open(yaml_path, "r") as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_yaml_config(yaml_path)
+        self._index_hosts()
+
+    @classmethod
+    def from_dict(cls, config, yaml_path):
+        """
+        Information:
+            Create a ConfigLoader around an already parsed configuration,
+            without reading, parsing or copying anything.
+            The loader takes the configuration over, the caller must not change it afterwards.
+
+        Parameters:
+            Input: config - Parsed configuration of the YAML file
+                  yaml_path - Path of the YAML file the configuration belongs to
+            Output: ConfigLoader instance
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        config_loader = cls.__new__(cls)
+        config_loader.yaml_path = yaml_path
+        config_loader.config = config
+        config_loader._index_hosts()
+        return config_loader
+
+    def _index_hosts(self):
+        """
+        Information:
+            Build the per-host lookup tables from the loaded configuration:
+            hostname to host configuration, hostname or IP address to host configuration,
+            hostname to the precomputed download information
+            (SFTP address, remote files and local directory), and the host select options.
+            Called whenever the configuration is (re)loaded.
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        base_local_dir = self.get('local_base_dir', '')
+        self._hosts_by_name = {}
+        self._hosts_by_key = {}
+        self._host_downloads = {}
+        self._host_options = {"all": "All"}
+        for host in self.get_sftp_hosts():
+            # The first host wins when a hostname or IP address is listed twice
+            for key in (host.get('hostname'), host.get('ip_address')):
+                if key is not None:
+                    self._hosts_by_key.setdefault(key, host)
+
+            # Shown in the host select, the hostname or else the IP address
+            name = host.get('hostname', host.get('ip_address'))
+            self._host_options[name] = name
+
+            hostname = host.get('hostname')
+            if hostname is None:
+                continue
+            self._hosts_by_name[hostname] = host
+            self._host_downloads[hostname] = {
+                "address": host.get('ip_address', hostname),
+                "remote_files": [f"/ide0/{resource}/for.dat" for resource in host.get('resources', [])],
+                "local_dir": os.path.join(base_local_dir, hostname) if base_local_dir else None
+            }
 
     def get_sftp_hosts(self):
         """
@@ -41,6 +213,53 @@ class ConfigLoader:
         """
         return self.config.get("sftp_hosts", [])
 
+    def get_sftp_host(self, hostname):
+        """
+        Information:
+            Look up a single SFTP host configuration by its hostname.
+            The hostname index is built once and reused until the configuration changes.
+
+        Parameters:
+            Input: hostname - The hostname of the SFTP host
+            Output: Host configuration dictionary or None if not found
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        return self._hosts_by_name.get(hostname)
+
+    def get_host(self, key):
+        """
+        Information:
+            Look up a single SFTP host configuration by its hostname or IP address,
+            as used for the keys of get_host_options().
+
+        Parameters:
+            Input: key - The hostname or IP address of the SFTP host
+            Output: Host configuration dictionary or None if not found
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        return self._hosts_by_key.get(key)
+
+    def get_host_download_info(self, host_cfg):
+        """
+        Information:
+            Retrieve the download information precomputed for a host at load time.
+
+        Parameters:
+            Input: host_cfg - Host configuration dictionary
+            Output: Dictionary with 'address' (IP address or hostname to connect to),
+                    'remote_files' (list of remote for.dat paths) and 'local_dir'
+                    (local download directory, None without local_base_dir),
+                    or None if the host has no hostname
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        return self._host_downloads.get(host_cfg.get('hostname'))
+
     def get_database_info(self):
         """
         Information:
@@ -59,6 +278,7 @@ class ConfigLoader:
         Information:
             Returns a dictionary of host options including an 'all' option.
             Maps hostnames or IP addresses to display names.
+            The options are built once per (re)load of the configuration, do not modify them.
 
         Parameters:
             Output: Dictionary with host identifiers as keys and display names as values
@@ -66,13 +286,7 @@ class ConfigLoader:
         Date: 03/06/2025
         Author: TOVY
         """
-        return {
-            "all": "All",
-            **{
-                host.get('hostname', host.get('ip_address')): host.get('hostname', host.get('ip_address'))
-                for host in self.get_sftp_hosts()
-            }
-        }
+        return self._host_options
 
     def get(self, param, default=None):
         """
@@ -94,16 +308,18 @@ class ConfigLoader:
             print(f"Error accessing configuration parameter '{param}': {e}")
             return default
 
-    def save_config(self, yaml_content, yaml_path=None):
+    def save_config(self, yaml_content, yaml_path=None, parsed_config=None):
         """
         Information:
             Save the provided YAML content to a file.
             Validates the YAML format before saving and updates the internal configuration.
             Uses the original path if no new path is provided.
+            Callers that already parsed the content pass it along, so it is not parsed twice.
 
         Parameters:
             Input: yaml_content - String containing YAML configuration to save
                   yaml_path - Path to save the YAML file to (optional)
+                  parsed_config - yaml_content already parsed by the caller (optional)
             Output: True if successful, raises exception otherwise
 
         Date: 03/06/2025
@@ -113,14 +329,27 @@ class ConfigLoader:
         # Validate YAML format before saving
         try:
             # Check if it's valid YAML
-            test_config = yaml.safe_load(yaml_content)
+            test_config = parse_yaml(yaml_content) if parsed_config is None else parsed_config
             
-            # Write to file
-            with open(path, "w") as file:
+            # Write to a temporary file next to the target, flushed to disk, and then swap it in,
+            # so the configuration file is never left half written
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "w") as file:
                 file.write(yaml_content)
-                
-            # Update the internal config with new content
-            self.config = test_config
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, path)
+
+            # Keep the parsed content in the cache, so the next load of the file needs no parse.
+            # The cache and this loader each need a configuration of their own; one of them
+            # takes the parsed configuration, only the other one gets a copy
+            if parsed_config is None:
+                _cache_yaml(path, test_config, yaml_content)
+                self.config = copy.deepcopy(test_config)
+            else:
+                _cache_yaml(path, copy.deepcopy(parsed_config), yaml_content)
+                self.config = parsed_config
+            self._index_hosts()
             
             return True
         except Exception as e:
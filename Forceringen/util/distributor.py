@@ -11,7 +11,8 @@ Author: TOVY
 """
 
 import os
-import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from Forceringen.PLC.ssh_connect_to_PLC import SFTPClient
 from Forceringen.PLC.convert_dat_file import FileReader, DataProcessor
 from Forceringen.PLC.Search_Access import DatabaseSearcher
@@ -20,6 +21,12 @@ from datetime import datetime
 from Forceringen.util.config_manager import ConfigLoader
 from Forceringen.Database.writes_bits_to_db import BitConversionDBWriter
 
+# Upper bound on the .dat files of one host that are processed at the same time
+MAX_FILE_WORKERS = 8
+
+# Parsed .dat files: local path -> ((mtime_ns, size), processed list)
+parsed_file_cache = {}
+
 def select_sftp_host(config_loader):
     """
     Information:
@@ -46,15 +53,13 @@ def select_sftp_host(config_loader):
         print(f"{i}. {disp_name} ({host.get('ip_address', 'no IP')})")
     print("all. Download from all hosts")
 
-    # Create a lookup dictionary for quick hostname access
-    hostname_to_host = {host.get('hostname'): host for host in sftp_hosts if 'hostname' in host}
-
     while True:
         selection = input(f"Type the hostname or 'all' to download from every host: ").strip()
         if selection == "all":
             return "all"
-        if selection in hostname_to_host:
-            return hostname_to_host[selection]
+        host_cfg = config_loader.get_sftp_host(selection)
+        if host_cfg:
+            return host_cfg
         else:
             print("Invalid selection. Please try again.")
 
@@ -84,28 +89,96 @@ def main():
     # If user chooses "all", iterate over all hosts:
     if host_selection == "all":
         for host_cfg in config_loader.get_sftp_hosts():
-            run_main_with_host(config_loader, host_cfg.get('hostname'))
+            run_main_with_host(config_loader, host_cfg)
     else:
-        host_cfg = host_selection
-        run_main_with_host(config_loader, host_cfg.get('hostname'))
+        run_main_with_host(config_loader, host_selection)
 
     end = datetime.now()
     print(f"\nTotal time taken: {(end - start).total_seconds()} seconds")
 
 
-def run_main_with_host(config_loader, selected_host_name, is_gui_context=False):
+def read_processed_list(local_file_path):
+    """
+    Information:
+        Reads and processes a force data file, reusing the previous result
+        as long as the file's modification time and size did not change.
+        Unchanged files are not re-downloaded, so they keep their modification time.
+
+    Parameters:
+        Input: local_file_path - Path to the downloaded .dat file
+        Output: List of processed word lists
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    file_stat = os.stat(local_file_path)
+    file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = parsed_file_cache.get(local_file_path)
+    if cached and cached[0] == file_key:
+        return cached[1]
+
+    file_reader = FileReader(local_file_path)
+    words_list = file_reader.read_and_parse_file()
+    processed_list = list(DataProcessor.convert_and_process_list(words_list))
+    parsed_file_cache[local_file_path] = (file_key, processed_list)
+    return processed_list
+
+
+def process_dat_file(local_file_path, plc, resource, db_path, department_name, verbose=False):
+    """
+    Information:
+        Processes a single downloaded force data file:
+        parses it, looks up its bits in the Access database and converts the values.
+        Uses its own DatabaseSearcher so several files can be processed in parallel threads.
+
+    Parameters:
+        Input: local_file_path - Path to the downloaded .dat file
+              plc - PLC name taken from the file name
+              resource - Resource name taken from the file name, also the Access table
+              db_path - Path to the Access database of the host
+              department_name - Department name from the configuration
+              verbose - Boolean indicating if the converted rows are printed
+        Output: List of converted bit dictionaries
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    table_part = resource  # The table is usually the resource part
+
+    custom_query = f"SELECT *, SecondComment FROM {table_part} WHERE Name IN ({{placeholders}})"
+    print(f"\n--- Processing {local_file_path} (table: {table_part}) ---")
+    processed_list = read_processed_list(local_file_path)
+
+    with DatabaseSearcher(db_path) as searcher:
+        results = searcher.search(
+            processed_list,
+            query_template=custom_query,
+            department_name=department_name,
+            plc=plc,
+            resource=resource
+        )
+
+    # Convert (rows are only printed when 'verbose' is set in the config)
+    bit_converter = BitConversion(results)
+    converted_results = bit_converter.convert_variable_list()
+    if verbose and converted_results:
+        print("\n".join(map(str, converted_results)))
+    return converted_results
+
+
+def run_main_with_host(config_loader, host_cfg, is_gui_context=False):
     """
     Information:
         Processes data for a specific host. This includes:
         1. Connecting to the host via SFTP and downloading force data files
-        2. Processing each file to extract bit data
-        3. Converting variable lists and printing results
-        4. Writing the data to the database using the appropriate method
-           based on whether it's running in a GUI context or not
+        2. Processing the files in parallel threads to extract bit data
+        3. Converting variable lists (printing them when 'verbose' is enabled)
+        4. Writing the data of all resources to the database in one batch, using the
+           appropriate method based on whether it's running in a GUI context or not
 
     Parameters:
         Input: config_loader - ConfigLoader instance with application configuration
-              selected_host_name - String specifying the hostname to process
+              host_cfg - Host configuration dictionary of the host to process
               is_gui_context - Boolean indicating if running in GUI context (affects database write method)
         Output: None, but prints status messages to console
 
@@ -115,28 +188,22 @@ def run_main_with_host(config_loader, selected_host_name, is_gui_context=False):
 
     start = datetime.now()
 
-    sftp_hosts = config_loader.get_sftp_hosts()
-    host_cfg = next((host for host in sftp_hosts if host.get("hostname") == selected_host_name), None)
     if not host_cfg:
-        print(f"Host {selected_host_name} not found.")
+        print("Host not found.")
+        return
+
+    # Address, remote files (/ide0/{resource}/for.dat) and local directory are precomputed at load time
+    download_info = config_loader.get_host_download_info(host_cfg)
+    if not download_info or not download_info["local_dir"]:
+        print("Error: local_base_dir or hostname is missing in the configuration or selected host.")
         return
 
-    hostname = host_cfg.get('ip_address', host_cfg.get('hostname'))
+    hostname = download_info["address"]
     port = host_cfg['port']
     username = host_cfg['username']
     password = host_cfg['password']
-
-    # UPDATED: Changed file path pattern from {hostname}/{resource}/for.dat to /ide0/{resource}/for.dat
-    resources = host_cfg.get('resources', [])
-    remote_files = [f"/ide0/{resource}/for.dat" for resource in resources]
-
-    base_local_dir = config_loader.get('local_base_dir', '')
-    host_name = host_cfg.get('hostname')
-    if base_local_dir and host_name:
-        local_base_dir = os.path.join(base_local_dir, host_name)
-    else:
-        print("Error: local_base_dir or hostname is missing in the configuration or selected host.")
-        return
+    remote_files = download_info["remote_files"]
+    local_base_dir = download_info["local_dir"]
 
     client = SFTPClient(hostname, port, username, password)
     client.connect()
@@ -144,74 +211,56 @@ def run_main_with_host(config_loader, selected_host_name, is_gui_context=False):
     client.download_files(remote_files, local_base_dir, host_cfg.get('hostname'))
     client.close()
 
-    if not os.path.exists(local_base_dir):
-        print(f"Error: Local directory '{local_base_dir}' does not exist after download.")
+    department_name = config_loader.get("department_name")
+    verbose = config_loader.get('verbose', False)
+    db_path = host_cfg.get('db_path')
+    if not db_path:
+        print("Error: db_path not specified for selected host.")
         return
 
-    department_name = config_loader.get("department_name")
+    try:
+        with os.scandir(local_base_dir) as entries:
+            dat_entries = [entry for entry in entries if entry.is_file() and entry.name.endswith(".dat")]
+    except FileNotFoundError:
+        print(f"Error: Local directory '{local_base_dir}' does not exist after download.")
+        return
 
-    for filename in os.listdir(str(local_base_dir)):
-        if filename.endswith(".dat"):
-            try:
-                plc, resource = filename.replace('.dat', '').split('_', 1)
-            except ValueError:
-                print(f"Filename '{filename}' does not contain expected '_' separator. Skipping.")
-                continue
-
-            table_part = resource  # The table is usually the resource part
-
-            custom_query = f"SELECT *, SecondComment FROM {table_part} WHERE Name IN ({{placeholders}})"
-            local_file_path = os.path.join(str(local_base_dir), filename)
-            print(f"\n--- Processing {local_file_path} (table: {table_part}) ---")
-            file_reader = FileReader(local_file_path)
-            words_list = file_reader.read_and_parse_file()
-            processed_list = list(DataProcessor.convert_and_process_list(words_list))
-
-            db_path = host_cfg.get('db_path')
-            if not db_path:
-                print("Error: db_path not specified for selected host.")
-                return
-            with DatabaseSearcher(db_path) as searcher:
-                results = searcher.search(
-                    processed_list,
-                    query_template=custom_query,
-                    department_name=department_name,
-                    plc=plc,
-                    resource=resource
-                )
-
-            # Step 1: Convert and print
-            bit_converter = BitConversion(results)
-            converted_results = bit_converter.convert_variable_list()
-            for sublist in converted_results:
-                print(sublist)
-
-            # Step 2: Write using already converted results (no double conversion)
-            writer = BitConversionDBWriter(converted_results, config_loader)
-            writer.convert_variable_list = lambda: converted_results
-    
-            if is_gui_context:
-                # Use threaded method in GUI context
-                print("Writing to database via threading...")
-                writer.write_to_database_threaded()
-            else:
-                # Use the original async approach
-                async def run_bit_conversion_and_write():
-                    await writer.write_to_database()
-            
-                # With this:
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        # Create task for background execution
-                        task = loop.create_task(run_bit_conversion_and_write())
-                        print("Database write task created")
-                    else:
-                        asyncio.run(run_bit_conversion_and_write())
-                except RuntimeError:
-                    asyncio.run(run_bit_conversion_and_write())
-                    print("Database write task created")
+    dat_files = []
+    for entry in dat_entries:
+        try:
+            plc, resource = entry.name.replace('.dat', '').split('_', 1)
+        except ValueError:
+            print(f"Filename '{entry.name}' does not contain expected '_' separator. Skipping.")
+            continue
+        dat_files.append((entry.path, plc, resource))
+
+    # Files are processed concurrently, the results of every resource are collected
+    # in file order and written to the database in one batch.
+    # Every file runs in a copy of the caller's context so context-bound state
+    # (such as captured GUI output) follows it into the worker threads
+    all_results = []
+    if dat_files:
+        caller_context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=min(MAX_FILE_WORKERS, len(dat_files))) as executor:
+            for converted_results in executor.map(
+                    lambda dat_file: caller_context.copy().run(
+                        process_dat_file, *dat_file, db_path, department_name, verbose),
+                    dat_files):
+                all_results.extend(converted_results)
+
+    if not all_results:
+        print("No resources to write to the database.")
+    else:
+        # Write using already converted results (no double conversion)
+        writer = BitConversionDBWriter(all_results, config_loader, already_converted=True)
 
+        if is_gui_context:
+            # Use threaded method in GUI context
+            print("Writing to database via threading...")
+            writer.write_to_database_threaded()
+        else:
+            # No event loop runs in the CLI, write on a fresh one
+            writer.write_to_database_sync()
 
     end = datetime.now()
     print(f"Total time taken: {(end - start).total_seconds()} seconds")
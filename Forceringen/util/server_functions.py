@@ -1,49 +1,190 @@
-import yaml
 import sys
+import json
 import io
+import time
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
 import sqlalchemy.exc  # Changed from psycopg2
-from Forceringen.util.config_manager import ConfigLoader
-from Forceringen.Database.insert_data_db_yaml import PLCResourceSync
+from Forceringen.util.config_manager import ConfigLoader, parse_yaml
 from Forceringen.Database.fetch_bits_db import PLCBitRepositoryAsync
-from Forceringen.util.unified_db_connection import DatabaseConnection  # Added import
 from shiny import reactive, ui
-from Forceringen.util import distributor
 
+logger = logging.getLogger(__name__)
 
-def run_distributor_and_capture_output(config_obj, selected_host_value):
+# Upper bound on the hosts processed at the same time when "all" is selected
+MAX_HOST_WORKERS = 32
+
+# Seconds a back-button refresh stays valid for the same PLC and resource
+BACK_REFRESH_TTL = 2.0
+
+# Seconds the data fetched by a PLC or resource button click stays valid for a repeated click
+CLICK_REFRESH_TTL = 2.0
+
+# Sync key (see database_sync_key) of the configuration last synchronized with the database
+last_synced_key = None
+
+# Stream that receives the output of the distributor run in the current context
+captured_output = contextvars.ContextVar("captured_output", default=None)
+
+
+class OutputTee:
+    """
+    Information:
+        File-like object that writes everything to several streams at once.
+        Used to capture output in a buffer while still showing it live on the console.
+
+    Parameters:
+        Input: streams - The streams to write to
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    def __init__(self, *streams):
+        self.streams = streams
+
+    def write(self, data):
+        for stream in self.streams:
+            stream.write(data)
+        return len(data)
+
+    def flush(self):
+        for stream in self.streams:
+            stream.flush()
+
+    def __getattr__(self, name):
+        # Other stream attributes (isatty, encoding, ...) come from the first stream
+        return getattr(self.streams[0], name)
+
+
+class ContextOutput:
     """
     Information:
-        Captures output from head module execution by temporarily redirecting
-        stdout and stderr to a buffer. Handles execution for a single host or
-        all hosts based on the selected value.
+        File-like object that writes to the captured_output stream of the current context,
+        or to the default stream when nothing is being captured.
+        Lets hosts that run in parallel threads each capture their own output.
+
+    Parameters:
+        Input: default_stream - Stream used outside a capturing context
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    def __init__(self, default_stream):
+        self.default_stream = default_stream
+
+    def write(self, data):
+        return (captured_output.get() or self.default_stream).write(data)
+
+    def flush(self):
+        (captured_output.get() or self.default_stream).flush()
+
+    def __getattr__(self, name):
+        # sys.stdout stays replaced for the rest of the process, so other stream attributes
+        # (isatty, encoding, fileno, buffer, ...) are forwarded to the stream in use as well
+        return getattr(captured_output.get() or self.default_stream, name)
+
+
+def run_host_with_output(config_obj, host_cfg, stream):
+    """
+    Information:
+        Runs the distributor for one host while its output is captured in the given stream.
+        Errors are written to the same stream, so one failing host does not stop the others.
+
+    Parameters:
+        Input: config_obj - ConfigLoader instance with application configuration
+              host_cfg - Host configuration dictionary of the host to process
+              stream - Stream that receives the host's output
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    # Imported on first run: the distributor pulls in paramiko and the Access driver
+    from Forceringen.util import distributor
+
+    token = captured_output.set(stream)
+    try:
+        distributor.run_main_with_host(config_obj, host_cfg, is_gui_context=True)
+    except Exception as e:
+        print(f"Error: {e}")
+    finally:
+        captured_output.reset(token)
+
+
+def install_context_output():
+    """
+    Information:
+        Route sys.stdout and sys.stderr through ContextOutput, once per process.
+        Output then goes to the captured_output stream of the printing context,
+        so captures of concurrent runs never swap the global streams back and forth.
+
+    Parameters:
+        Output: The original stdout stream, for showing output live on the console
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    if not isinstance(sys.stdout, ContextOutput):
+        sys.stdout = ContextOutput(sys.stdout)
+    if not isinstance(sys.stderr, ContextOutput):
+        sys.stderr = ContextOutput(sys.stderr)
+    return sys.stdout.default_stream
+
+
+def run_distributor_and_capture_output(config_obj, selected_host_value, buffer=None):
+    """
+    Information:
+        Captures output from head module execution in a buffer of its own context,
+        teed to the original stdout so progress stays visible on the console while it runs.
+        Handles execution for a single host or all hosts based on the selected value.
+        All hosts are processed in parallel threads, each capturing its own output,
+        which is joined per host in configuration order as soon as the host is done.
+        Blocking, so the GUI runs it in a worker thread and reads the buffer
+        it passed in while the run is still going.
 
     Parameters:
         Input: config_obj - ConfigLoader instance with application configuration
               selected_host_value - String specifying the host to process or "all"
+              buffer - Stream that receives the output (optional, a new StringIO otherwise)
         Output: String containing the captured console output
 
     Date: 03/06/2025
     Author: TOVY
     """
-    buffer = io.StringIO()
-    old_stdout = sys.stdout
-    old_stderr = sys.stderr
-    sys.stdout = sys.stderr = buffer
+    # Imported on first run: the distributor pulls in paramiko and the Access driver
+    from Forceringen.util import distributor
+
+    if buffer is None:
+        buffer = io.StringIO()
+    console = install_context_output()
+    token = captured_output.set(OutputTee(buffer, console))
     try:
         if selected_host_value == "all":
-            # For 'all', call it for every host in the yaml_file
-            for host in config_obj.get_sftp_hosts():
-                host_name = host.get('hostname', host.get('ip_address'))
-                print(f"=== {host_name} ===")
-                distributor.run_main_with_host(config_obj, host_name, is_gui_context=True)
-                print()
+            # For 'all', run every host in the yaml_file at the same time
+            hosts = config_obj.get_sftp_hosts()
+            host_buffers = [io.StringIO() for _ in hosts]
+            if hosts:
+                with ThreadPoolExecutor(max_workers=min(MAX_HOST_WORKERS, len(hosts))) as executor:
+                    futures = [
+                        executor.submit(run_host_with_output, config_obj, host, OutputTee(host_buffer, console))
+                        for host, host_buffer in zip(hosts, host_buffers)
+                    ]
+
+                    # Add each host's output once it and the hosts before it are done
+                    for host, host_buffer, future in zip(hosts, host_buffers, futures):
+                        future.result()
+                        host_name = host.get('hostname', host.get('ip_address'))
+                        buffer.write(f"=== {host_name} ===\n{host_buffer.getvalue()}\n")
         else:
-            distributor.run_main_with_host(config_obj, selected_host_value, is_gui_context=True)
+            host_cfg = config_obj.get_sftp_host(selected_host_value)
+            if not host_cfg:
+                print(f"Host {selected_host_value} not found.")
+            else:
+                distributor.run_main_with_host(config_obj, host_cfg, is_gui_context=True)
     except Exception as e:
         print(f"Error: {e}")
     finally:
-        sys.stdout = old_stdout
-        sys.stderr = old_stderr
+        captured_output.reset(token)
     return buffer.getvalue()
 
 def validate_yaml(yaml_content, save_message):
@@ -61,7 +202,7 @@ def validate_yaml(yaml_content, save_message):
     Author: TOVY
     """
     try:
-        test_config = yaml.safe_load(yaml_content)
+        test_config = parse_yaml(yaml_content)
         return test_config
     except Exception as e:
         save_message.set(f"Error: Invalid YAML format - {str(e)}")
@@ -83,13 +224,14 @@ def update_configuration(yaml_content, test_config, config_loader, save_message)
     Date: 03/06/2025
     Author: TOVY
     """
-    # Save to file
-    config_loader.save_config(yaml_content)
+    # Save to file, the content was already parsed by validate_yaml
+    config_loader.save_config(yaml_content, parsed_config=test_config)
     save_message.set("Configuration saved successfully!")
 
 
-    # Reinitialize config loader
-    config_loader = ConfigLoader(yaml_path=config_loader.yaml_path)
+    # Reinitialize config loader around the configuration the saving loader now holds,
+    # a new object so the reactive values holding the loader see the change
+    config_loader = ConfigLoader.from_dict(config_loader.config, config_loader.yaml_path)
 
     return test_config, config_loader
 
@@ -120,9 +262,7 @@ def update_ui_components(config_loader, inputs, selected_resource, resource_butt
     current_resource = selected_resource()
 
     if current_host != "all" and current_resource is not None:
-        host_cfg = next((host for host in config_loader.get_sftp_hosts()
-                         if host.get('hostname') == current_host or
-                         host.get('ip_address') == current_host), None)
+        host_cfg = config_loader.get_host(current_host)
 
         if host_cfg:
             resources = host_cfg.get('resources', [])
@@ -132,6 +272,27 @@ def update_ui_components(config_loader, inputs, selected_resource, resource_butt
     # Trigger resource buttons refresh
     resource_buttons_trigger.set(resource_buttons_trigger() + 1)
 
+def database_sync_key(config_loader):
+    """
+    Information:
+        Builds a key of the configuration parts the database synchronization depends on:
+        the database settings, the local base directory and the resources per PLC.
+        Edits that leave the key unchanged (comments, formatting, IP addresses, ...)
+        need no synchronization.
+
+    Parameters:
+        Input: config_loader - ConfigLoader instance
+        Output: String key
+
+    Date: 16/10/2026
+    Author: TOVY
+    """
+    return json.dumps([
+        config_loader.get('database'),
+        config_loader.get('local_base_dir', ''),
+        [[host.get('hostname'), host.get('resources', [])] for host in config_loader.get_sftp_hosts()]
+    ], sort_keys=True, default=str)
+
 async def sync_with_database(config_loader, save_message, session):
     """
     Information:
@@ -139,6 +300,8 @@ async def sync_with_database(config_loader, save_message, session):
         Updates save_message with status updates and error messages.
         Handles various error conditions including import errors and
         database connection failures.
+        Skipped when the configuration parts used by the synchronization did not
+        change since the last successful synchronization.
 
     Parameters:
         Input: config_loader - Updated ConfigLoader instance
@@ -148,6 +311,13 @@ async def sync_with_database(config_loader, save_message, session):
     Date: 03/06/2025
     Author: TOVY
     """
+    global last_synced_key
+
+    sync_key = database_sync_key(config_loader)
+    if sync_key == last_synced_key:
+        save_message.set("Configuration saved (no database sync needed).")
+        return
+
     try:
         # Update status
         save_message.set("Configuration saved. Synchronizing database...")
@@ -155,9 +325,15 @@ async def sync_with_database(config_loader, save_message, session):
         # Force UI update
         await session.send_custom_message("force_update", {})
 
-        # Sync database - PLCResourceSync creates its own connection
+        # Imported on first save, the ImportError handler below reports a missing module
+        from Forceringen.Database.insert_data_db_yaml import PLCResourceSync
+
+        # Sync database - PLCResourceSync borrows a connection from the shared pool.
+        # Pools opened for a previous database configuration are closed first
         plc_sync = PLCResourceSync(config_loader)
+        await plc_sync.db_connection.close_stale_pools()
         await plc_sync.sync_async()  # Remove the conn parameter
+        last_synced_key = sync_key
 
         # Update status
         save_message.set("Configuration saved and database synchronized successfully!")
@@ -167,18 +343,21 @@ async def sync_with_database(config_loader, save_message, session):
     except sqlalchemy.exc.OperationalError as db_conn_err:
         save_message.set(f"Configuration saved but database connection failed: {str(db_conn_err)}")
     except Exception as db_error:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"Database sync error: {error_details}")
+        # The traceback is only formatted when a handler actually emits the record
+        logger.exception("Database sync error")
         save_message.set(f"Configuration saved but database sync failed: {str(db_error)}")
         
 def create_resource_click_handler(config, inputs, selected_resource, selected_plc, selected_view, plc_bits_data, config_loader):
     """
     Information:
         Creates a reactive effect handler for resource button clicks.
-        Tracks click counts to detect only new clicks and prevent duplicate processing.
+        Every click arrives as one resource_clicked event carrying the button number,
+        sent by the delegated click listener of the page, so only new clicks are processed.
         When a resource button is clicked, it updates the selected resource and PLC,
         changes the view to "resource", and fetches the bit data for the selected resource.
+        The fetch is skipped when the same resource was fetched less than
+        CLICK_REFRESH_TTL seconds ago, for example on a double click,
+        as long as plc_bits_data still holds the results of that fetch.
 
     Parameters:
         Input: config - Application configuration dictionary
@@ -194,56 +373,45 @@ def create_resource_click_handler(config, inputs, selected_resource, selected_pl
     Author: TOVY
     """
 
-    # Track previous click counts to detect NEW clicks only
-    previous_resource_clicks = {}
-    
+    # One repository for every click, the handler is recreated when the config changes
+    repo = PLCBitRepositoryAsync(config_loader)
+
+    # (PLC, resource, monotonic time, results) of the last fetch done by this handler
+    last_fetch = [None, None, 0.0, None]
+
     @reactive.effect
+    @reactive.event(inputs.resource_clicked)
     async def handle_resource_clicks():
-        sftp_hosts = config.get('sftp_hosts', [])
-        selected_host_val = inputs.host_select()
+        click = inputs.resource_clicked()
 
-        # Filter the right host(s)
-        if selected_host_val == "all":
-            hosts = sftp_hosts
-        else:
-            hosts = [h for h in sftp_hosts if
-                     h.get('hostname') == selected_host_val or h.get('ip_address') == selected_host_val]
-
-        for i, host in enumerate(hosts):
-            resources = host.get('resources', [])
-            for j, resource in enumerate(resources):
-                btn_id = f"resource_{j}"
-                if hasattr(inputs, btn_id):
-                    btn_input = getattr(inputs, btn_id)
-                    current_count = btn_input()
-                    
-                    # Get previous count for this button (default to 0)
-                    prev_count = previous_resource_clicks.get(btn_id, 0)
-                    
-                    # Only process if there's a NEW click (current > previous)
-                    if current_count > prev_count:
-                        hostname = host.get("hostname", host.get("ip_address"))
-                        selected_resource.set(resource)
-                        selected_plc.set(hostname)
-                        selected_view.set("resource")
-                        print(f"NEW click - Selected resource: {resource} on PLC: {hostname}")
-                        print(f"Selected view: {selected_view()}")
-
-                        # --- Fetch plc_bits for this PLC and resource ---
-                        repo = PLCBitRepositoryAsync(config_loader)
-
-                        async def get_bits():
-                            return await repo.fetch_plc_bits(hostname, resource_name=resource)
-
-                        results = await get_bits()
-                        plc_bits_data.set(results)
-
-                        print("Results from plc_bits view:")
-                        for row in results:
-                            print(row)
-                    
-                    # Update the stored count
-                    previous_resource_clicks[btn_id] = current_count
+        # Resource buttons are numbered per resource of the selected host
+        host_cfg = config_loader.get_host(inputs.host_select())
+        resources = host_cfg.get('resources', []) if host_cfg else []
+        index = int(click.get('index', -1))
+        if not 0 <= index < len(resources):
+            return
+
+        resource = resources[index]
+        hostname = host_cfg.get("hostname", host_cfg.get("ip_address"))
+        selected_resource.set(resource)
+        selected_plc.set(hostname)
+        selected_view.set("resource")
+        logger.debug("NEW click - Selected resource: %s on PLC: %s", resource, hostname)
+
+        now = time.monotonic()
+        if ([hostname, resource] == last_fetch[:2] and now - last_fetch[2] < CLICK_REFRESH_TTL
+                and plc_bits_data() is last_fetch[3]):
+            # Data was fetched moments ago and nothing replaced it since, keep the current plc_bits_data
+            return
+
+        # --- Fetch plc_bits for this PLC and resource ---
+        results = await repo.fetch_plc_bits(hostname, resource_name=resource)
+        plc_bits_data.set(results)
+        last_fetch[:] = [hostname, resource, now, results]
+
+        # Dumping every row is only worth its cost while debugging
+        if results and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Results from plc_bits view:\n%s", "\n".join(map(str, results)))
 
     return handle_resource_clicks
 
@@ -251,10 +419,14 @@ def create_plc_click_handler(config, inputs, selected_plc, selected_resource, se
     """
     Information:
         Creates a reactive effect handler for PLC button clicks.
-        Tracks click counts to detect only new clicks and prevent duplicate processing.
+        Every click arrives as one plc_clicked event carrying the button number,
+        sent by the delegated click listener of the page, so only new clicks are processed.
         When a PLC button is clicked (only when "all" is selected in the dropdown),
         it updates the selected PLC, clears the selected resource,
         changes the view to "ALL", and fetches all bit data for the selected PLC.
+        The fetch is skipped when the same PLC was fetched less than
+        CLICK_REFRESH_TTL seconds ago, for example on a double click,
+        as long as plc_bits_data still holds the results of that fetch.
 
     Parameters:
         Input: config - Application configuration dictionary
@@ -270,49 +442,44 @@ def create_plc_click_handler(config, inputs, selected_plc, selected_resource, se
     Author: TOVY
     """
 
-    # Track previous click counts to detect NEW clicks only
-    previous_plc_clicks = {}
+    # One repository for every click, the handler is recreated when the config changes
+    repo = PLCBitRepositoryAsync(config_loader)
 
-    @reactive.effect
-    async def handle_plc_clicks():
+    # (PLC, monotonic time, results) of the last fetch done by this handler
+    last_fetch = [None, 0.0, None]
 
-        sftp_hosts = config.get('sftp_hosts', [])
+    # PLC name per button number, fixed for the config this handler was created with
+    plc_names = [host.get("hostname", host.get("ip_address")) for host in config.get('sftp_hosts', [])]
 
+    @reactive.effect
+    @reactive.event(inputs.plc_clicked)
+    async def handle_plc_clicks():
         if inputs.host_select() != "all":
             return  # only active when "all" is selected
 
-        for i, host in enumerate(sftp_hosts):
-            btn_id = f"plc_{i}"
-            if hasattr(inputs, btn_id):
-                btn_input = getattr(inputs, btn_id)
-                current_count = btn_input()
-
-                # Get previous count for this button (default to 0)
-                prev_count = previous_plc_clicks.get(btn_id, 0)
-
-                # Only process if there's a NEW click (current > previous)
-                if current_count > prev_count:
-                    hostname = host.get("hostname", host.get("ip_address"))
-                    print(f"NEW click - PLC clicked: {hostname}")
-                    selected_plc.set(hostname)
-                    selected_resource.set(None)
+        index = int(inputs.plc_clicked().get('index', -1))
+        if not 0 <= index < len(plc_names):
+            return
 
-                    selected_view.set("ALL")
+        hostname = plc_names[index]
+        logger.debug("NEW click - PLC clicked: %s", hostname)
+        selected_plc.set(hostname)
+        selected_resource.set(None)
 
-                    repo = PLCBitRepositoryAsync(config_loader)
+        selected_view.set("ALL")
 
-                    async def get_bits():
-                        return await repo.fetch_plc_bits(hostname)
+        now = time.monotonic()
+        if hostname == last_fetch[0] and now - last_fetch[1] < CLICK_REFRESH_TTL and plc_bits_data() is last_fetch[2]:
+            # Data was fetched moments ago and nothing replaced it since, keep the current plc_bits_data
+            return
 
-                    results = await get_bits()
-                    plc_bits_data.set(results)
+        results = await repo.fetch_plc_bits(hostname)
+        plc_bits_data.set(results)
+        last_fetch[:] = [hostname, now, results]
 
-                    print("Results for PLC:", hostname)
-                    for row in results:
-                        print(row)
-                
-                # Update the stored count
-                previous_plc_clicks[btn_id] = current_count
+        # Dumping every row is only worth its cost while debugging
+        if results and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Results for PLC %s:\n%s", hostname, "\n".join(map(str, results)))
 
     return handle_plc_clicks
 
@@ -322,7 +489,8 @@ def create_detail_click_handler(plc_bits_data, inputs, selected_bit_detail, sele
     """
     Information:
         Creates a reactive effect handler for detail button clicks.
-        Tracks click counts to detect only new clicks and prevent duplicate processing.
+        Every click arrives as one detail_btn_clicked event carrying the row number,
+        sent by the delegated click listener of the page, so only new clicks are processed.
         When a detail button is clicked, it updates the selected bit detail,
         changes the view to "detail", and fetches the bit history data.
 
@@ -340,39 +508,30 @@ def create_detail_click_handler(plc_bits_data, inputs, selected_bit_detail, sele
     Author: TOVY
     """
 
-    # Track previous click counts to detect NEW clicks only
-    previous_clicks = {}
+    # One repository for every click, the handler is recreated when the config changes
+    repository = PLCBitRepositoryAsync(config_loader)
 
     @reactive.effect
+    @reactive.event(inputs.detail_btn_clicked)
     async def handle_detail_clicks():
         data = plc_bits_data()
-        for i, item in enumerate(data):
-            detail_btn_id = f"detail_btn_{i}"
-            if hasattr(inputs, detail_btn_id):
-                btn_input = getattr(inputs, detail_btn_id)
-                current_count = btn_input()
-
-                # Get previous count for this button (default to 0)
-                prev_count = previous_clicks.get(detail_btn_id, 0)
-
-                # Only process if there's a NEW click (current > previous)
-                if current_count > prev_count:
-                    selected_bit_detail.set(item)
-                    selected_view.set("detail")
-                    print(f"Detail view for bit: {item.get('bit_number', '')}")
+        index = int(inputs.detail_btn_clicked().get('index', -1))
+        if not 0 <= index < len(data):
+            return
 
-                    # Fetch history data for this bit
-                    repository = PLCBitRepositoryAsync(config_loader)
-                    history_results = await repository.fetch_bit_history(item, selected_plc())
-                    bit_history_data.set(history_results)
+        item = data[index]
+        selected_bit_detail.set(item)
+        selected_view.set("detail")
+        logger.debug("Detail view for bit: %s", item.get('bit_number', ''))
 
-                # Update the stored count
-                previous_clicks[detail_btn_id] = current_count
+        # Fetch history data for this bit
+        history_results = await repository.fetch_bit_history(item, selected_plc())
+        bit_history_data.set(history_results)
 
     return handle_detail_clicks
 
 
-def create_save_reason_handler(inputs, plc_bits_data, selected_plc, selected_resource, save_message, config_loader, selected_bit_detail=None, bit_history_data=None):
+def create_save_reason_handler(inputs, plc_bits_data, selected_plc, selected_resource, save_message, config_loader, selected_bit_detail=None, bit_history_data=None, session=None):
     """
     Information:
         Creates a unified reactive effect handler for saving reason and forced_by values
@@ -388,81 +547,145 @@ def create_save_reason_handler(inputs, plc_bits_data, selected_plc, selected_res
               config_loader - ConfigLoader instance for database access
               selected_bit_detail - Optional reactive value for the selected bit detail (detail view)
               bit_history_data - Optional reactive value to store the bit history data (detail view)
+              session - Optional Shiny session, used to flash the saved table rows
         Output: Reactive effect function that handles saving reasons on Enter key
 
     Date: 08/06/2025
     Author: TOVY
     """
 
-    # Handler for table view (resource/ALL view)
+    # One repository (and its DatabaseConnection) for every save, the handler is recreated
+    # when the config changes
+    repository = PLCBitRepositoryAsync(config_loader)
+
+    # Handler for table view (resource/ALL view), rows saved within a short time arrive together
     @reactive.effect
     @reactive.event(inputs.save_reason_triggered)
     async def handle_save_reason_table():
-        await _save_reason_common("table", inputs.save_reason_triggered())
+        await _save_reasons_table(inputs.save_reason_triggered())
 
     # Handler for detail view
     @reactive.effect
     @reactive.event(inputs.save_reason_detail_triggered)
     async def handle_save_reason_detail():
-        await _save_reason_common("detail", inputs.save_reason_detail_triggered())
+        await _save_reason_detail(inputs.save_reason_detail_triggered())
 
-    async def _save_reason_common(view_type, trigger_data):
-        """Common logic for saving reasons in both views"""
+    async def _save_reasons_table(trigger_data):
+        """Save the reasons of the table rows sent together, with one batch call"""
         if not trigger_data:
             return
 
-        # ✅ Extra defensieve check voor view type
-        if view_type == "detail":
-            bit_data = selected_bit_detail()
-            if not bit_data:
-                print("Warning: Save reason triggered for detail view but no bit selected - ignoring")
-                return  # ✅ Gewoon returnen zonder error message te zetten
-    
-        # Get data based on view type
-        if view_type == "table":
-            # Table view logic
-            index = int(trigger_data.get('index', -1))
-            reason_text = trigger_data.get('reasonValue', '')
-            melding_text = trigger_data.get('meldingValue', '')  # Add melding extraction
-            forced_text = trigger_data.get('forcedValue', '')
-
-            data = plc_bits_data()
-            if not data or index < 0 or index >= len(data):
-                print("Warning: Save reason triggered for table view but no valid data - ignoring")
-                return
-
-            record = data[index]
-            plc_name = selected_plc.get()
-            resource_name = selected_resource.get()
-            bit_number = record.get('bit_number')
-
-        else:  # detail view
-            # Detail view logic
-            reason_text = trigger_data.get('reasonValue', '')
-            melding_text = trigger_data.get('meldingValue', '')
-            forced_text = trigger_data.get('forcedValue', '')
-
-            bit_data = selected_bit_detail()
-            if not bit_data:
-                print("Warning: Save reason triggered for detail view but no bit selected - ignoring")
-                return
-
-            plc_name = bit_data.get('PLC') or selected_plc()
-            resource_name = bit_data.get('resource') or selected_resource()
-            bit_number = bit_data.get('bit_number')
-            record = bit_data
-
-        print(f"Saving reason in {view_type} view for bit {bit_number} on PLC {plc_name} resource {resource_name}...")
+        # Rows are identified by the PLC, resource and bit sent along with them, not by their
+        # position, because the table may show another resource by the time the save arrives
+        data = plc_bits_data()
+        rows_by_key = {
+            (str(record.get('PLC')), str(record.get('resource')), str(record.get('bit_number'))): record
+            for record in data or []
+        }
+
+        # (plc, resource, bit number, reason, melding, forced_by) per valid row, and the
+        # record of each of those rows in the table currently shown (None when not shown)
+        updates = []
+        shown_records = []
+        for row in trigger_data.get('rows', []):
+            key = (row.get('plc'), row.get('resource'), row.get('bitNumber'))
+            if not all(key):
+                logger.warning("Save reason triggered for a table row without PLC, resource or bit - ignoring")
+                continue
+            updates.append((
+                *key,
+                row.get('reasonValue', ''),
+                row.get('meldingValue', ''),
+                row.get('forcedValue', '')
+            ))
+            shown_records.append(rows_by_key.get(key))
+        if not updates:
+            return
+
+        bit_numbers = ", ".join(bit_number for _, _, bit_number, _, _, _ in updates)
+        logger.debug("Saving reason in table view for bits %s...", bit_numbers)
 
         try:
-            # Create DB connection using unified connection
-            db_connection = DatabaseConnection(config_loader)
-            conn = await db_connection.get_connection(is_async=True)
+            # One pooled connection, one batch call and one commit for all rows
+            async with repository.db_connection.transaction() as conn:
+                await conn.executemany(
+                    PLCBitRepositoryAsync.INSERT_REASON_QUERY,
+                    [
+                        {
+                            "plc_name": plc_name,
+                            "resource_name": resource_name,
+                            "bit_number": bit_number,
+                            "reason_text": reason_text,
+                            "melding_text": melding_text,
+                            "forced_text": forced_text
+                        }
+                        for plc_name, resource_name, bit_number, reason_text, melding_text, forced_text in updates
+                    ]
+                )
 
-            try:
+        except Exception as e:
+            save_message.set(f"Error: {str(e)}")
+            logger.error("Database error: %s", e)
+            return
+
+        for update, record in zip(updates, shown_records):
+            plc_name, resource_name, bit_number, reason_text, melding_text, forced_text = update
+            logger.debug("Updated reason for bit %s to: %s", bit_number, reason_text)
+            logger.debug("Updated melding for bit %s to: %s", bit_number, melding_text)
+            logger.debug("Updated forced_by for bit %s to: %s", bit_number, forced_text)
+
+            if record is None:
+                # Saved for a table that is no longer shown, there is no record to update
+                continue
+
+            # Update the record in place; the table inputs already show the saved
+            # values, so plc_bits_data is not replaced and the table is not re-rendered
+            record['reason'] = reason_text
+            record['melding'] = melding_text
+            record['forced_by'] = forced_text
+
+        # Only the saved rows are highlighted on the page, the table itself is not sent again.
+        # Rows are matched on their PLC, resource and bit, so a table shown since then is left alone
+        if session is not None:
+            await session.send_custom_message("flash_row", {
+                "rows": [
+                    {"plc": plc_name, "resource": resource_name, "bit": bit_number}
+                    for plc_name, resource_name, bit_number, _, _, _ in updates
+                ]
+            })
+
+        if len(updates) == 1:
+            save_message.set(f"Reason saved for bit {bit_numbers}")
+        else:
+            save_message.set(f"Reasons saved for bits {bit_numbers}")
+
+    async def _save_reason_detail(trigger_data):
+        """Save the reason of the bit shown in the detail view"""
+        if not trigger_data:
+            return
+
+        bit_data = selected_bit_detail()
+        if not bit_data:
+            logger.warning("Save reason triggered for detail view but no bit selected - ignoring")
+            return  # ✅ Gewoon returnen zonder error message te zetten
+
+        reason_text = trigger_data.get('reasonValue', '')
+        melding_text = trigger_data.get('meldingValue', '')
+        forced_text = trigger_data.get('forcedValue', '')
+
+        plc_name = bit_data.get('PLC') or selected_plc()
+        resource_name = bit_data.get('resource') or selected_resource()
+        bit_number = bit_data.get('bit_number')
+        record = bit_data
+
+        logger.debug("Saving reason in detail view for bit %s on PLC %s resource %s...", bit_number, plc_name, resource_name)
+
+        try:
+            # Borrow a pooled DB connection from the repository's unified connection
+            async with repository.db_connection.acquire() as conn:
                 # Update the reason in the database with SQL Server syntax - FIXED PARAMETER ORDER
                 result = await conn.execute(
-                    "EXEC insert_force_reason :plc_name, :resource_name, :bit_number, :reason_text, :melding_text, :forced_text",
+                    PLCBitRepositoryAsync.INSERT_REASON_QUERY,
                     {
                         "plc_name": plc_name,
                         "resource_name": resource_name,
@@ -476,41 +699,44 @@ def create_save_reason_handler(inputs, plc_bits_data, selected_plc, selected_res
                 # Check result and update status
                 if result:
                     save_message.set(f"Reason saved for bit {bit_number}")
-                    print(f"Updated reason for bit {bit_number} to: {reason_text}")
-                    print(f"Updated melding for bit {bit_number} to: {melding_text}")
-                    print(f"Updated forced_by for bit {bit_number} to: {forced_text}")
-
-                    # Update local data based on view type
-                    if view_type == "table":
-                        # Update table data
-                        record['reason'] = reason_text
-                        record['melding'] = melding_text  # Add melding update
-                        record['forced_by'] = forced_text
-                        new_data = data.copy()
-                        new_data[index] = record
-                        plc_bits_data.set(new_data)
-                    else:  # detail view
-                        # Update detail data
-                        updated_bit_data = record.copy()
-                        updated_bit_data['reason'] = reason_text
-                        updated_bit_data['melding'] = melding_text  # Add melding update
-                        updated_bit_data['forced_by'] = forced_text
-                        selected_bit_detail.set(updated_bit_data)
-
-                        # Refresh history data if available
-                        if bit_history_data is not None:
-                            repository = PLCBitRepositoryAsync(config_loader)
-                            history_results = await repository.fetch_bit_history(updated_bit_data, selected_plc())
-                            bit_history_data.set(history_results)
+                    logger.debug("Updated reason for bit %s to: %s", bit_number, reason_text)
+                    logger.debug("Updated melding for bit %s to: %s", bit_number, melding_text)
+                    logger.debug("Updated forced_by for bit %s to: %s", bit_number, forced_text)
+
+                    # Update the row in plc_bits_data in place, like the table save does, so the
+                    # list shown again by the back button (without a refresh within
+                    # BACK_REFRESH_TTL) has the saved values. The detail view holds a copy
+                    # after an earlier save, so the row is looked up by its key
+                    bit_key = (record.get('PLC'), record.get('resource'), bit_number)
+                    for row in plc_bits_data():
+                        if (row.get('PLC'), row.get('resource'), row.get('bit_number')) == bit_key:
+                            row['reason'] = reason_text
+                            row['melding'] = melding_text
+                            row['forced_by'] = forced_text
+
+                    # Update detail data
+                    updated_bit_data = record.copy()
+                    updated_bit_data['reason'] = reason_text
+                    updated_bit_data['melding'] = melding_text  # Add melding update
+                    updated_bit_data['forced_by'] = forced_text
+                    selected_bit_detail.set(updated_bit_data)
+
+                    # Refresh history data if available, on the connection of the save
+                    if bit_history_data is not None:
+                        try:
+                            history_results = await repository.fetch_bit_history_on(
+                                conn, updated_bit_data, selected_plc())
+                        except Exception as history_error:
+                            logger.error("Error fetching bit history: %s", history_error)
+                            history_results = []
+                        bit_history_data.set(history_results)
 
                 else:
                     save_message.set(f"Failed to save reason for bit {bit_number}")
-            finally:
-                await conn.disconnect()
 
         except Exception as e:
             save_message.set(f"Error: {str(e)}")
-            print(f"Database error: {str(e)}")
+            logger.error("Database error: %s", e)
 
     return handle_save_reason_table, handle_save_reason_detail
 
@@ -520,6 +746,8 @@ def create_back_button_handler(inputs, selected_resource, selected_view, plc_bit
         Creates a reactive effect handler for the back button in the detail view.
         When clicked, it returns to either the resource view or the PLC view,
         depending on the current context, and refreshes the bit data.
+        The refresh is skipped when the same PLC and resource were refreshed
+        less than BACK_REFRESH_TTL seconds ago and plc_bits_data still holds that refresh.
 
     Parameters:
         Input: inputs - Shiny inputs object
@@ -534,23 +762,36 @@ def create_back_button_handler(inputs, selected_resource, selected_view, plc_bit
     Author: TOVY
     """
 
+    # (PLC, resource, monotonic time, results) of the last refresh done by this handler
+    last_fetch = [None, None, 0.0, None]
+
+    # One repository for every click, the handler is recreated when the config changes
+    repo = PLCBitRepositoryAsync(config_loader)
+
     @reactive.effect
     @reactive.event(inputs.back_to_list)
     async def handle_back_button():
+        plc = selected_plc()
+        resource = selected_resource()
+
         # Return to the appropriate view based on what was selected
-        if selected_resource():
-            selected_view.set("resource")
+        selected_view.set("resource" if resource else "ALL")
+
+        now = time.monotonic()
+        if ([plc, resource] == last_fetch[:2] and now - last_fetch[2] < BACK_REFRESH_TTL
+                and plc_bits_data() is last_fetch[3]):
+            # Data was refreshed moments ago and nothing replaced it since, keep the current plc_bits_data
+            return
+
+        if resource:
             # Refresh the resource data
-            repo = PLCBitRepositoryAsync(config_loader)
-            results = await repo.fetch_plc_bits(selected_plc(), resource_name=selected_resource())
-            plc_bits_data.set(results)
-            print(f"Refreshed data for resource {selected_resource()} on PLC {selected_plc()}")
+            results = await repo.fetch_plc_bits(plc, resource_name=resource)
+            logger.debug("Refreshed data for resource %s on PLC %s", resource, plc)
         else:
-            selected_view.set("ALL")
             # Refresh the PLC data
-            repo = PLCBitRepositoryAsync(config_loader)
-            results = await repo.fetch_plc_bits(selected_plc())
-            plc_bits_data.set(results)
-            print(f"Refreshed data for PLC {selected_plc()}")
+            results = await repo.fetch_plc_bits(plc)
+            logger.debug("Refreshed data for PLC %s", plc)
+        plc_bits_data.set(results)
+        last_fetch[:] = [plc, resource, now, results]
 
     return handle_back_button
\ No newline at end of file
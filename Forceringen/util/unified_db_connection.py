@@ -1,6 +1,41 @@
-import inspect
+import asyncio
+import logging
+import re
+from contextlib import asynccontextmanager
 from sqlalchemy import text
 import aioodbc
+import pyodbc
+
+logger = logging.getLogger(__name__)
+
+# Default size of the aioodbc connection pools, overridable with
+# pool_min_size / pool_max_size in the database section of the config
+POOL_MIN_SIZE = 1
+POOL_MAX_SIZE = 8
+
+# Pools shared by all DatabaseConnection instances, keyed on (connection string, event loop)
+# because an aioodbc pool can only be used on the event loop that created it
+_async_pools = {}
+
+# Attempts to open a connection before a connection error is raised,
+# waiting CONNECT_RETRY_DELAY seconds after the first failure and doubling it after every next one
+CONNECT_ATTEMPTS = 3
+CONNECT_RETRY_DELAY = 0.1
+
+# Seconds to wait for a connection or pool to roll back or close before giving up on it
+CLOSE_TIMEOUT = 5
+
+# Releases of connections whose rollback outlasted CLOSE_TIMEOUT, still waiting for the driver;
+# referenced here so the event loop does not drop the tasks before they ran
+_late_releases = set()
+
+# Lock per event loop, so concurrent first queries on a loop create only one pool
+_pool_locks = {}
+
+# Named query parameters (:name) and the cache of their positional conversions,
+# keyed on (query, parameter names): (query with '?' placeholders, parameter order)
+NAMED_PARAMETER = re.compile(r":(\w+)")
+_positional_queries = {}
 
 
 class DatabaseConnection:
@@ -35,12 +70,17 @@ class DatabaseConnection:
         self.sync_connection = None
         self.async_engine = None
         self.async_connection = None
+        self.async_pool = None
+        # Database configuration and connection string, built once (see invalidate_config)
+        self._cached_config = None
+        self._cached_connection_string = None
 
     def _get_db_config(self):
         """
         Information:
             Get database configuration from the config loader with default values.
             This is an internal helper method used by connection methods.
+            The dictionary is built once and reused until invalidate_config() is called.
 
         Parameters:
             Output: Dictionary with database connection parameters
@@ -48,8 +88,11 @@ class DatabaseConnection:
         Date: 03/06/2025
         Author: TOVY
         """
+        if self._cached_config is not None:
+            return self._cached_config
+
         db_config = self.config_loader.get_database_info()
-        return {
+        self._cached_config = {
             "host": db_config.get("host", "localhost"),
             "port": db_config.get("port", 1433),
             "database": db_config.get("database"),
@@ -57,8 +100,24 @@ class DatabaseConnection:
             "integrated_security": db_config.get("integrated_security"),
             "user": db_config.get("user"),
             "password": db_config.get("password"),
-            "driver": db_config.get("driver", "ODBC Driver 17 for SQL Server")
+            "driver": db_config.get("driver", "ODBC Driver 17 for SQL Server"),
+            "pool_min_size": db_config.get("pool_min_size", POOL_MIN_SIZE),
+            "pool_max_size": db_config.get("pool_max_size", POOL_MAX_SIZE)
         }
+        return self._cached_config
+
+    def invalidate_config(self):
+        """
+        Information:
+            Forget the cached database configuration and connection string,
+            so the next connection reads them again from the config loader.
+            Call this after the configuration of the config loader was changed.
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        self._cached_config = None
+        self._cached_connection_string = None
 
     def _build_async_connection_string(self, db_config):
         """
@@ -79,30 +138,187 @@ class DatabaseConnection:
             # SQL Server Authentication
             return f"DRIVER={{{db_config['driver']}}};SERVER={db_config['host']},{db_config['port']};DATABASE={db_config['database']};UID={db_config['user']};PWD={db_config['password']}"
 
+    async def _get_async_pool(self):
+        """
+        Information:
+            Get the aioodbc connection pool for this database on the running event loop.
+            The pool is created on first use and shared by every DatabaseConnection instance,
+            so connections are reused instead of being opened and closed per query.
+            Pools left behind by event loops that were closed without close_pools()
+            are dropped when a new pool is created.
+
+        Parameters:
+            Output: aioodbc connection pool
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        db_config = self._get_db_config()
+        if self._cached_connection_string is None:
+            self._cached_connection_string = self._build_async_connection_string(db_config)
+        connection_string = self._cached_connection_string
+        loop = asyncio.get_running_loop()
+        key = (connection_string, loop)
+        pool = _async_pools.get(key)
+        if pool is None:
+            async with _pool_locks.setdefault(loop, asyncio.Lock()):
+                # Another coroutine may have created the pool while this one waited
+                pool = _async_pools.get(key)
+                if pool is None:
+                    # A pool of a closed loop can never be used again, forget it (and its loop).
+                    # Other threads may add pools meanwhile, so work on a snapshot of the keys
+                    for closed_key in [closed_key for closed_key in list(_async_pools) if closed_key[1].is_closed()]:
+                        _async_pools.pop(closed_key, None)
+                    for closed_loop in [closed_loop for closed_loop in list(_pool_locks) if closed_loop.is_closed()]:
+                        _pool_locks.pop(closed_loop, None)
+
+                    pool = await aioodbc.create_pool(
+                        dsn=connection_string,
+                        minsize=db_config["pool_min_size"],
+                        maxsize=db_config["pool_max_size"]
+                    )
+                    _async_pools[key] = pool
+        return pool
+
+    async def warmup(self):
+        """
+        Information:
+            Open the pool's minimum number of connections ahead of the first query,
+            checking each one with SELECT 1, so the first user does not pay the
+            connection set-up time. Errors are reported, not raised.
+
+        Parameters:
+            Output: Boolean indicating if the pool is ready
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        async def check(pool):
+            connection = await pool.acquire()
+            try:
+                cursor = await connection.cursor()
+                try:
+                    await cursor.execute("SELECT 1")
+                    await cursor.fetchone()
+                finally:
+                    await cursor.close()
+            finally:
+                await pool.release(connection)
+
+        try:
+            pool = await self._get_async_pool()
+            await asyncio.gather(*(check(pool) for _ in range(self._get_db_config()["pool_min_size"])))
+            return True
+        except Exception:
+            logger.exception("Database warmup error")
+            return False
+
+    @staticmethod
+    async def close_pools():
+        """
+        Information:
+            Close the connection pools created on the running event loop.
+            Must be awaited before an event loop that used get_connection() is closed,
+            for example at the end of an asyncio.run() call.
+            A pool waits for its borrowed connections to come back; after CLOSE_TIMEOUT
+            seconds the remaining ones are abandoned, so shutdown never hangs on them.
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        loop = asyncio.get_running_loop()
+        # Other threads may add pools meanwhile, so work on a snapshot of the keys
+        for key in [key for key in list(_async_pools) if key[1] is loop]:
+            await DatabaseConnection._close_pool(_async_pools.pop(key))
+        _pool_locks.pop(loop, None)
+
+    async def close_stale_pools(self):
+        """
+        Information:
+            Close the connection pools on the running event loop that were opened
+            for another connection string than the current database configuration,
+            for example after the server or credentials were changed in the YAML file.
+            The pool of the current configuration is kept, so its open connections
+            are reused by the next query.
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        self.invalidate_config()
+        connection_string = self._build_async_connection_string(self._get_db_config())
+        loop = asyncio.get_running_loop()
+        # Other threads may add pools meanwhile, so work on a snapshot of the keys
+        for key in [key for key in list(_async_pools) if key[1] is loop and key[0] != connection_string]:
+            await self._close_pool(_async_pools.pop(key))
+
+    @staticmethod
+    async def _close_pool(pool):
+        """
+        Information:
+            Close a connection pool, waiting at most CLOSE_TIMEOUT seconds
+            for its borrowed connections to come back.
+
+        Parameters:
+            Input: pool - aioodbc connection pool, already removed from the shared pools
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        pool.close()
+        try:
+            await asyncio.wait_for(pool.wait_closed(), timeout=CLOSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Connection pool did not close within %s seconds, abandoning it", CLOSE_TIMEOUT)
+
+    async def _open_async(self):
+        """
+        Information:
+            Borrow a connection from the shared aioodbc pool and wrap it.
+            Single place where asynchronous connections are opened, used by
+            connect_async(), get_connection() and acquire().
+            Transient connection failures (pyodbc.OperationalError) are retried
+            CONNECT_ATTEMPTS times with a growing delay before the error is raised.
+
+        Parameters:
+            Output: DatabaseConnectionWrapper around the pooled connection
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        delay = CONNECT_RETRY_DELAY
+        for attempt in range(1, CONNECT_ATTEMPTS + 1):
+            try:
+                pool = await self._get_async_pool()
+                connection = await pool.acquire()
+                break
+            except pyodbc.OperationalError:
+                if attempt == CONNECT_ATTEMPTS:
+                    raise
+                logger.warning("Database connection attempt %s failed, retrying in %s seconds", attempt, delay)
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        logger.debug("Connected asynchronously to SQL Server database: %s", self._get_db_config()['database'])
+        return DatabaseConnectionWrapper(connection, is_async=True, pool=pool)
+
     async def connect_async(self):
         """
         Information:
             Establish an asynchronous connection to the SQL Server database using aioodbc.
-            Stores the connection as an instance attribute.
+            The connection is borrowed from the shared connection pool and
+            stored as an instance attribute until disconnect_async() hands it back.
             Provides feedback about connection status.
 
         Parameters:
-            Output: Boolean indicating connection success or failure
+            Output: True once connected, connection errors are raised
 
         Date: 03/06/2025
         Author: TOVY
         """
-        try:
-            db_config = self._get_db_config()
-            connection_string = self._build_async_connection_string(db_config)
-            
-            self.async_connection = await aioodbc.connect(dsn=connection_string)
-            
-            print(f"Connected asynchronously to SQL Server database: {db_config['database']}")
-            return True
-        except Exception as e:
-            print(f"Asynchronous database connection error: {e}")
-            return False
+        conn = await self._open_async()
+        self.async_connection = conn.connection
+        self.async_pool = conn.pool
+        return True
 
     def disconnect(self):
         """
@@ -120,60 +336,125 @@ class DatabaseConnection:
         if self.sync_engine:
             self.sync_engine.dispose()
             self.sync_engine = None
-            print("Database connection closed")
+            logger.debug("Database connection closed")
 
     async def disconnect_async(self):
         """
         Information:
-            Close the asynchronous database connection.
-            Resets instance attribute to None after closing.
-            Provides feedback when connection is closed.
+            Release the asynchronous database connection back to its pool.
+            The connection is rolled back first, so the next user never sees uncommitted work.
+            Resets instance attributes to None afterwards.
+            Provides feedback when connection is released.
 
         Date: 03/06/2025
         Author: TOVY
         """
         if self.async_connection:
-            await self.async_connection.close()
+            await DatabaseConnectionWrapper(
+                self.async_connection, is_async=True, pool=self.async_pool
+            ).disconnect()
             self.async_connection = None
-            print("Asynchronous database connection closed")
+            self.async_pool = None
+            logger.debug("Asynchronous database connection closed")
 
     async def get_connection(self, is_async=None):
         """
         Information:
             Get a database connection in either synchronous or asynchronous mode.
             This method doesn't store the connection as an instance attribute.
+            Asynchronous connections are borrowed from the shared connection pool;
+            calling disconnect() on the returned wrapper hands them back.
             Can automatically detect if called from an async context.
 
         Parameters:
             Input: is_async - Override automatic detection of async context
                    True for aioodbc connection, False for SQLAlchemy connection,
                    None for automatic detection
-            Output: Database connection object (SQLAlchemy or aioodbc connection)
+            Output: DatabaseConnectionWrapper around a pooled aioodbc connection,
+                    or None in synchronous mode; connection errors are raised
 
         Date: 03/06/2025
         Author: TOVY
         """
-        # If is_async is None, auto-detect based on calling context
+        # If is_async is None, auto-detect based on calling context:
+        # async when an event loop is running in this thread
         if is_async is None:
-            current_frame = inspect.currentframe()
-            calling_frame = inspect.getouterframes(current_frame)[1]
-            is_async = inspect.iscoroutinefunction(calling_frame.function)
+            try:
+                asyncio.get_running_loop()
+                is_async = True
+            except RuntimeError:
+                is_async = False
 
-        try:
-            db_config = self._get_db_config()
-
-            if is_async:
-                # Asynchronous connection with aioodbc
-                connection_string = self._build_async_connection_string(db_config)
-                connection = await aioodbc.connect(dsn=connection_string)
-                print(f"Connected asynchronously to SQL Server database: {db_config['database']}")
-                return DatabaseConnectionWrapper(connection, is_async=True)
+        if not is_async:
+            # Synchronous connections are not provided
             return None
 
-        except Exception as e:
-            connection_type = "asynchronous" if is_async else "synchronous"
-            print(f"Database {connection_type} connection error: {e}")
-            return None
+        # Asynchronous connection from the aioodbc pool
+        return await self._open_async()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Information:
+            Borrow a pooled asynchronous connection for the duration of an 'async with' block.
+            The connection is handed back to the pool when the block ends, also when it raises,
+            so callers no longer need their own try/finally around disconnect().
+
+        Parameters:
+            Output: DatabaseConnectionWrapper around the pooled connection
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        conn = await self.get_connection(is_async=True)
+        try:
+            yield conn
+        finally:
+            await conn.disconnect()
+
+    async def gather_queries(self, queries, as_tuples=False):
+        """
+        Information:
+            Run independent SELECT queries at the same time, each on its own pooled connection,
+            so the total time is that of the slowest query instead of the sum of all of them.
+            Only for queries that do not depend on each other's results.
+
+        Parameters:
+            Input: queries - List of (query, parameters) tuples, parameters may be None
+                  as_tuples - Return the rows as tuples (fetch_tuples) instead of dictionaries
+            Output: List with the fetch_all() (or fetch_tuples()) result of every query, in the order given
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        async def fetch(query, parameters):
+            async with self.acquire() as conn:
+                if as_tuples:
+                    return await conn.fetch_tuples(query, parameters)
+                return await conn.fetch_all(query, parameters)
+
+        return await asyncio.gather(*(fetch(query, parameters) for query, parameters in queries))
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Information:
+            Borrow a pooled asynchronous connection for a group of statements
+            that is committed once, as a single transaction, when the block ends.
+            Statements inside the block do not commit on their own. When the block
+            raises, nothing is committed and the work is rolled back on release.
+
+        Parameters:
+            Output: DatabaseConnectionWrapper around the pooled connection
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        async with self.acquire() as conn:
+            conn.in_transaction = True
+            yield conn
+            conn.in_transaction = False
+            await conn.commit()
 
     # Async context manager support
     async def __aenter__(self):
@@ -194,7 +475,7 @@ class DatabaseConnectionWrapper:
     Author: TOVY
     """
     
-    def __init__(self, connection, is_async=False, engine=None):
+    def __init__(self, connection, is_async=False, engine=None, pool=None):
         """
         Information:
             Initialize the wrapper with a connection object.
@@ -203,6 +484,7 @@ class DatabaseConnectionWrapper:
             Input: connection - SQLAlchemy or aioodbc connection
                   is_async - Boolean indicating if this is an async connection
                   engine - SQLAlchemy engine (for sync connections only)
+                  pool - aioodbc pool the connection was acquired from (async only)
 
         Date: 03/06/2025
         Author: TOVY
@@ -210,6 +492,58 @@ class DatabaseConnectionWrapper:
         self.connection = connection
         self.is_async = is_async
         self.engine = engine
+        self.pool = pool
+        # Set by DatabaseConnection.transaction(): statements leave the commit to the block
+        self.in_transaction = False
+
+    def _convert_parameters(self, query, parameters):
+        """
+        Information:
+            Convert a query with named :parameters to the positional '?' form used by aioodbc.
+            Values are ordered by their position in the query.
+
+        Parameters:
+            Input: query - SQL query string with :name placeholders
+                  parameters - Dictionary of query parameters
+            Output: Tuple of (query with '?' placeholders, list of parameter values)
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        query_converted, names = self._positional_query(query, parameters)
+        return query_converted, [parameters[name] for name in names]
+
+    def _positional_query(self, query, parameters):
+        """
+        Information:
+            Convert a query with named :parameters to the positional '?' form
+            and the order in which the parameter values must be passed.
+            The conversion is done once per query text and parameter names and then reused,
+            so repeated queries only pay a dictionary lookup.
+
+        Parameters:
+            Input: query - SQL query string with :name placeholders
+                  parameters - Dictionary (or other collection) of the query's parameter names
+            Output: Tuple of (query with '?' placeholders, list of parameter names in value order)
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        key = (query, tuple(parameters))
+        converted = _positional_queries.get(key)
+        if converted is None:
+            names = []
+
+            def replace(match):
+                if match.group(1) not in parameters:
+                    return match.group(0)
+                names.append(match.group(1))
+                return "?"
+
+            converted = (NAMED_PARAMETER.sub(replace, query), names)
+            _positional_queries[key] = converted
+
+        return converted
 
     async def fetch_all(self, query, parameters=None):
         """
@@ -230,10 +564,7 @@ class DatabaseConnectionWrapper:
             try:
                 if parameters:
                     # Convert named parameters to positional for aioodbc
-                    param_values = list(parameters.values())
-                    query_converted = query
-                    for key, value in parameters.items():
-                        query_converted = query_converted.replace(f":{key}", "?")
+                    query_converted, param_values = self._convert_parameters(query, parameters)
                     await cursor.execute(query_converted, param_values)
                 else:
                     await cursor.execute(query)
@@ -250,6 +581,41 @@ class DatabaseConnectionWrapper:
                 result = self.connection.execute(text(query))
             return [dict(row._mapping) for row in result]
 
+    async def fetch_tuples(self, query, parameters=None):
+        """
+        Information:
+            Execute a SELECT query and return all results as plain tuples in column order.
+            Skips building a dictionary per row, for callers that unpack rows by position.
+            Works with both sync and async connections.
+
+        Parameters:
+            Input: query - SQL query string
+                  parameters - Dictionary of query parameters
+            Output: List of result rows as tuples
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        if self.is_async:
+            cursor = await self.connection.cursor()
+            try:
+                if parameters:
+                    # Convert named parameters to positional for aioodbc
+                    query_converted, param_values = self._convert_parameters(query, parameters)
+                    await cursor.execute(query_converted, param_values)
+                else:
+                    await cursor.execute(query)
+
+                return [tuple(row) for row in await cursor.fetchall()]
+            finally:
+                await cursor.close()
+        else:
+            if parameters:
+                result = self.connection.execute(text(query), parameters)
+            else:
+                result = self.connection.execute(text(query))
+            return [tuple(row) for row in result]
+
     async def fetch_one(self, query, parameters=None):
         """
         Information:
@@ -268,10 +634,8 @@ class DatabaseConnectionWrapper:
             cursor = await self.connection.cursor()
             try:
                 if parameters:
-                    param_values = list(parameters.values())
-                    query_converted = query
-                    for key, value in parameters.items():
-                        query_converted = query_converted.replace(f":{key}", "?")
+                    # Convert named parameters to positional for aioodbc
+                    query_converted, param_values = self._convert_parameters(query, parameters)
                     await cursor.execute(query_converted, param_values)
                 else:
                     await cursor.execute(query)
@@ -291,15 +655,19 @@ class DatabaseConnectionWrapper:
             row = result.fetchone()
             return dict(row._mapping) if row else None
 
-    async def execute(self, query, parameters=None):
+    async def execute(self, query, parameters=None, commit=True):
         """
         Information:
             Execute an INSERT, UPDATE, or DELETE query.
             Works with both sync and async connections.
+            Pass commit=False to group several statements and call commit() once,
+            or run them inside DatabaseConnection.transaction().
 
         Parameters:
             Input: query - SQL query string
                   parameters - Dictionary of query parameters
+                  commit - Commit the transaction after executing (default True),
+                           ignored inside DatabaseConnection.transaction()
             Output: Number of affected rows
 
         Date: 03/06/2025
@@ -309,15 +677,14 @@ class DatabaseConnectionWrapper:
             cursor = await self.connection.cursor()
             try:
                 if parameters:
-                    param_values = list(parameters.values())
-                    query_converted = query
-                    for key, value in parameters.items():
-                        query_converted = query_converted.replace(f":{key}", "?")
+                    # Convert named parameters to positional for aioodbc
+                    query_converted, param_values = self._convert_parameters(query, parameters)
                     await cursor.execute(query_converted, param_values)
                 else:
                     await cursor.execute(query)
                 
-                await self.connection.commit()
+                if commit and not self.in_transaction:
+                    await self.connection.commit()
                 return cursor.rowcount
             finally:
                 await cursor.close()
@@ -326,25 +693,148 @@ class DatabaseConnectionWrapper:
                 result = self.connection.execute(text(query), parameters)
             else:
                 result = self.connection.execute(text(query))
-            self.connection.commit()
+            if commit and not self.in_transaction:
+                self.connection.commit()
             return result.rowcount
 
+    async def executemany(self, query, parameters_list, commit=True):
+        """
+        Information:
+            Execute one INSERT, UPDATE, DELETE or EXEC statement for every parameter set
+            in a single call, instead of one execute() per row.
+            Works with both sync and async connections.
+
+        Parameters:
+            Input: query - SQL query string
+                  parameters_list - List of dictionaries of query parameters, all with the same names
+                  commit - Commit the transaction after executing (default True),
+                           ignored inside DatabaseConnection.transaction()
+            Output: Number of affected rows as reported by the driver
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        if not parameters_list:
+            return 0
+
+        if self.is_async:
+            cursor = await self.connection.cursor()
+            try:
+                # Convert named parameters to positional for aioodbc, once for all rows
+                query_converted, names = self._positional_query(query, parameters_list[0])
+                await cursor.executemany(
+                    query_converted, [[parameters[name] for name in names] for parameters in parameters_list]
+                )
+
+                if commit and not self.in_transaction:
+                    await self.connection.commit()
+                return cursor.rowcount
+            finally:
+                await cursor.close()
+        else:
+            result = self.connection.execute(text(query), parameters_list)
+            if commit and not self.in_transaction:
+                self.connection.commit()
+            return result.rowcount
+
+    async def commit(self):
+        """
+        Information:
+            Commit the current transaction.
+            Used after one or more execute() calls made with commit=False.
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        if self.is_async:
+            await self.connection.commit()
+        else:
+            self.connection.commit()
+
     async def disconnect(self):
         """
         Information:
             Close the database connection.
             Works with both sync and async connections.
+            Pooled connections are rolled back and released to their pool instead,
+            so the next user never sees uncommitted work.
+            Waits at most CLOSE_TIMEOUT seconds for an async rollback or close. A rollback
+            that takes longer keeps running, and the connection goes back to its pool
+            once the driver is done with it, so the caller is not blocked and the pool
+            does not lose the connection.
 
         Date: 03/06/2025
         Author: TOVY
         """
-        if self.is_async:
-            await self.connection.close()
+        if self.is_async and self.pool is not None:
+            rollback = asyncio.ensure_future(self.connection.rollback())
+            try:
+                # Shielded, so the rollback is not cancelled when the wait gives up
+                await asyncio.wait_for(asyncio.shield(rollback), timeout=CLOSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                # Still busy in the driver, it cannot be reused or safely closed from here
+                logger.warning("Connection did not roll back within %s seconds, releasing it later", CLOSE_TIMEOUT)
+                rollback.add_done_callback(self._release_after_rollback)
+                return
+            except asyncio.CancelledError:
+                # The caller was cancelled, the connection still goes back once the rollback ends
+                rollback.add_done_callback(self._release_after_rollback)
+                raise
+            except Exception:
+                # A broken connection is closed, the pool drops it on release
+                await self.connection.close()
+            await self.pool.release(self.connection)
+        elif self.is_async:
+            try:
+                await asyncio.wait_for(self.connection.close(), timeout=CLOSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("Connection did not close within %s seconds, abandoning it", CLOSE_TIMEOUT)
         else:
             self.connection.close()
             if self.engine:
                 self.engine.dispose()
 
+    def _release_after_rollback(self, rollback):
+        """
+        Information:
+            Done-callback of a rollback that outlasted CLOSE_TIMEOUT in disconnect().
+            Schedules the release of the connection to its pool.
+
+        Parameters:
+            Input: rollback - The finished rollback task
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        task = asyncio.ensure_future(self._release_late(rollback))
+        _late_releases.add(task)
+        task.add_done_callback(_late_releases.discard)
+
+    async def _release_late(self, rollback):
+        """
+        Information:
+            Release the connection to its pool after a late rollback.
+            A connection whose rollback failed is closed first, so the pool drops it
+            and opens a new one in its place.
+
+        Parameters:
+            Input: rollback - The finished rollback task
+
+        Date: 16/10/2026
+        Author: TOVY
+        """
+        try:
+            if rollback.cancelled() or rollback.exception() is not None:
+                await self.connection.close()
+        except Exception:
+            logger.exception("Closing a connection after a failed rollback failed")
+        try:
+            await self.pool.release(self.connection)
+        except Exception:
+            logger.exception("Releasing a connection after a late rollback failed")
+        else:
+            logger.info("Connection released to its pool after a late rollback")
+
 
 # Usage examples:
 
@@ -353,18 +843,27 @@ class DatabaseConnectionWrapper:
 #     result = db.sync_connection.execute(text("SELECT * FROM table"))
 #     results = [dict(row._mapping) for row in result]
 
-# Example 2: Asynchronous connection with async context manager
+# Example 2: Asynchronous pooled connection with async context manager (released on exit)
 # async with DatabaseConnection(config_loader) as db:
 #     cursor = await db.async_connection.cursor()
 #     await cursor.execute("SELECT * FROM table")
 #     results = await cursor.fetchall()
 
-# Example 3: Get a standalone connection (doesn't store in the instance)
+# Example 3: Borrow a pooled connection for one block (released to the pool on exit)
 # async def example_function():
 #     db = DatabaseConnection(config_loader)
-#     conn = await db.get_connection()
-#     try:
-#         results = await conn.fetch_all("SELECT * FROM table")
-#         return results
-#     finally:
-#         await conn.disconnect()
\ No newline at end of file
+#     async with db.acquire() as conn:
+#         return await conn.fetch_all("SELECT * FROM table")
+# Example 4: Several statements committed together (rolled back if the block raises)
+# async def example_transaction():
+#     async with DatabaseConnection(config_loader).transaction() as conn:
+#         await conn.execute("EXEC delete_plc_all_bits :plc_name", {"plc_name": "BTEST"})
+#         await conn.execute("DELETE FROM plc WHERE plc_name = :plc_name", {"plc_name": "BTEST"})
+
+# Example 5: Run one statement for many rows in a single call instead of an execute() per row
+# async def example_bulk(rows):
+#     async with DatabaseConnection(config_loader).acquire() as conn:
+#         await conn.executemany(
+#             "DELETE FROM resource WHERE resource_name = :resource_name",
+#             [{"resource_name": row} for row in rows]
+#         )